@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional, Set
 import logging
 
+import aiohttp
 from aiohttp import web
 
 from .protocols import ExchangeProtocol
@@ -13,11 +14,14 @@ class ExchangeCoordinator:
     """거래소 관련 서비스들을 조율하는 코디네이터 클래스"""
     exchange: ExchangeProtocol
 
-    def __init__(self, api_key: str, secret_key: str, app: web.Application, exchange_name: str):
+    def __init__(self, api_key: str, secret_key: str, app: web.Application, exchange_name: str,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.name = exchange_name
         self.logger = logging.getLogger(exchange_name)
         self.app = app
         self.config = app['config'].get('exchanges', {}).get(self.name.lower(), {})
+        # 추적 코인 목록 전송에 사용하는 브로드캐스트 함수 (app은 시작 시 한 번만 구성됨)
+        self._broadcast_message = app['broadcast_message']
 
         # 기본 설정
         self.quote_currency = self.config.get('quote_currency')
@@ -26,7 +30,7 @@ class ExchangeCoordinator:
         self.whitelist: List[str] = []
 
         # 교환 연결 생성
-        self._create_exchange(api_key, secret_key)
+        self._create_exchange(api_key, secret_key, session)
 
         # 서비스들 초기화
         self._init_services()
@@ -37,8 +41,8 @@ class ExchangeCoordinator:
         self.watcher_restart_lock = asyncio.Lock()
 
 
-    def _create_exchange(self, api_key: str, secret_key: str) -> None:
-        """거래소 connection 생성"""
+    def _create_exchange(self, api_key: str, secret_key: str, session: Optional[aiohttp.ClientSession] = None) -> None:
+        """거래소 connection 생성 (session이 주어지면 다른 거래소와 HTTP 연결 풀을 공유)"""
         from .utils.exchange.exchange_factory import get_exchange
 
         if 'testnet' in self.config and self.config['testnet'].get('use', False):
@@ -46,7 +50,7 @@ class ExchangeCoordinator:
             self.whitelist = self.config['testnet'].get('whitelist', [])
 
         # Use the factory to get a configured exchange instance
-        self.exchange = get_exchange(self.name, api_key, secret_key)
+        self.exchange = get_exchange(self.name, api_key, secret_key, session)
         
         # ccxtpro's watch_* methods are available on ccxt.async_support instances too
         self.exchange.options.update({
@@ -69,15 +73,21 @@ class ExchangeCoordinator:
     async def get_initial_data(self) -> None:
         """초기 데이터 로드 (REST + 설정)"""
         try:
-            # NLP 트레이더 초기화 (마켓 정보 로딩)
+            # NLP 트레이더 초기화 (마켓 정보 로딩)와 잔고 및 주문 데이터 조달을 동시에 수행
+            # (ccxt는 진행 중인 load_markets를 공유하므로 마켓을 중복 로딩하지 않음)
             nlptrade_config = self.app['config'].get('nlptrade', {})
-            await self.nlp_trade_manager.initialize(nlptrade_config)
-
-            # 잔고 및 주문 데이터 조달
-            balance, open_orders = await asyncio.gather(
+            # 하나가 실패해도 나머지 요청이 모두 끝난 뒤 예외를 다시 발생시킴
+            # (진행 중인 요청이 남은 상태로 아래 except에서 거래소 연결을 닫지 않도록)
+            results = await asyncio.gather(
+                self.nlp_trade_manager.initialize(nlptrade_config),
                 self.exchange.fetch_balance(),
-                self.exchange.fetch_open_orders()
+                self.exchange.fetch_open_orders(),
+                return_exceptions=True
             )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            _, balance, open_orders = results
 
             # 주문 관리자에 주문들 초기화
             await self.order_manager.initialize_orders(open_orders)
@@ -160,7 +170,7 @@ class ExchangeCoordinator:
                 'exchange': self.name,
                 'follows': list(self.tracked_assets - {self.quote_currency}) # 기준 통화 제외
             }
-            await self.app['broadcast_message'](tracked_coins_message)
+            await self._broadcast_message(tracked_coins_message)
             self.logger.info(f"Broadcasted updated tracked coins to all clients: {tracked_coins_message['follows']}")
 
 
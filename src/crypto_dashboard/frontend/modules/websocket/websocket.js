@@ -19,6 +19,52 @@ import { formatTradeCommandForConfirmation } from '../utils/utils.js';
 let websocket;
 let reconnectTimeout;
 
+/**
+ * 가격 업데이트 목록을 반영합니다. 가격 저장소와 가격 차이는 한 번만 갱신하고 카드는 심볼별로 다시 렌더링합니다.
+ * @param {string} exchange - 거래소 이름
+ * @param {Array<{symbol: string, price: number, percentage: number, unrealised_pnl: ?string}>} updates - 가격 업데이트 목록
+ */
+function applyPriceUpdates(exchange, updates) {
+    const prices = {};
+    const percentages = {};
+    for (const update of updates) {
+        prices[update.symbol] = parseFloat(update.price);
+        percentages[update.symbol] = parseFloat(update.percentage);
+    }
+    updateCurrentPrices(prices);
+    // percentage 데이터를 별도로 업데이트
+    updateCurrentPercentages(percentages);
+    updatePriceDiffs();
+
+    const modal = document.getElementById("details-modal");
+    for (const update of updates) {
+        // Also trigger a re-render for the main crypto card
+        const uniqueIdPrice = `${exchange}_${update.symbol}`;
+        const cardPrice = document.getElementById(uniqueIdPrice);
+        if (!cardPrice) continue;
+
+        const free = parseFloat(cardPrice.dataset.free || 0);
+        const locked = parseFloat(cardPrice.dataset.locked || 0);
+        const value = update.price * (free + locked);
+
+        const renderDataPrice = {
+            ...cardPrice.dataset, // Preserve all existing data
+            symbol: update.symbol,
+            price: update.price,
+            percentage: update.percentage,
+            value: value,
+            unrealised_pnl: update.unrealised_pnl // 백엔드에서 계산된 값 사용
+        };
+        renderCryptoCard(renderDataPrice);
+
+        // 만약 상세 모달이 열려있고, 해당 코인의 모달이라면 내용 업데이트
+        if (modal.style.display === "block" && modal.dataset.currentCryptoId === uniqueIdPrice) {
+            const updatedCard = document.getElementById(uniqueIdPrice);
+            updateDetailsModalContent(updatedCard.dataset);
+        }
+    }
+}
+
 /**
  * WebSocket 연결을 시도합니다.
  */
@@ -108,40 +154,19 @@ export function connectWebSocket() {
                     }
                     break;
                 case 'orders_update':
+                    // 거래소 이름은 메시지에 한 번만 포함되므로 각 주문에 설정
+                    if (data.exchange) {
+                        data.data.forEach(order => { order.exchange = data.exchange; });
+                    }
                     updateCachedOrders(data.data);
                     updateOrdersList();
                     break;
                 case 'price_update':
-                    updateCurrentPrices({ [data.symbol]: parseFloat(data.price) });
-                    // percentage 데이터를 별도로 업데이트
-                    updateCurrentPercentages({ [data.symbol]: parseFloat(data.percentage) });
-                    updatePriceDiffs();
-
-                    // Also trigger a re-render for the main crypto card
-                    const uniqueIdPrice = `${data.exchange}_${data.symbol}`;
-                    const cardPrice = document.getElementById(uniqueIdPrice);
-                    if (cardPrice) {
-                        const free = parseFloat(cardPrice.dataset.free || 0);
-                        const locked = parseFloat(cardPrice.dataset.locked || 0);
-                        const value = data.price * (free + locked);
-
-                        const renderDataPrice = {
-                            ...cardPrice.dataset, // Preserve all existing data
-                            symbol: data.symbol,
-                            price: data.price,
-                            percentage: data.percentage,
-                            value: value,
-                            unrealised_pnl: data.unrealised_pnl // 백엔드에서 계산된 값 사용
-                        };
-                        renderCryptoCard(renderDataPrice);
-
-                        // 만약 상세 모달이 열려있고, 해당 코인의 모달이라면 내용 업데이트
-                        const modal = document.getElementById("details-modal");
-                        if (modal.style.display === "block" && modal.dataset.currentCryptoId === uniqueIdPrice) {
-                            const updatedCard = document.getElementById(uniqueIdPrice);
-                            updateDetailsModalContent(updatedCard.dataset);
-                        }
-                    }
+                    applyPriceUpdates(data.exchange, [data]);
+                    break;
+                case 'price_updates':
+                    // watch_tickers 한 번의 결과를 묶어서 받은 가격 업데이트
+                    applyPriceUpdates(data.exchange, data.updates);
                     break;
                 case 'log':
                     addCachedLog(data);
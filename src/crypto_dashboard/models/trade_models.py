@@ -1,8 +1,15 @@
 """
 거래 관련 데이터 모델 모듈
 """
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """데이터클래스의 필드 이름 목록 (클래스별로 한 번만 계산)"""
+    return tuple(f.name for f in fields(cls))
 
 
 @dataclass
@@ -21,6 +28,10 @@ class TradeIntent:
     total_cost: Optional[str] = None  # 총 주문 비용
     is_oco: bool = False # OCO 주문 여부를 나타내는 플래그
 
+    def to_dict(self) -> Dict[str, Any]:
+        """asdict와 같은 dict를 반환 (필드가 모두 불변 값이므로 deepcopy 없이 복사)"""
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
 
 @dataclass
 class TradeCommand(TradeIntent):
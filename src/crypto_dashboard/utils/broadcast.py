@@ -3,13 +3,24 @@
 프론트엔드 클라이언트들에게 메시지를 전송하는 기능을 제공합니다.
 """
 import asyncio
+from collections import deque
 from datetime import datetime, timezone
+from decimal import Decimal
+import json
 import logging
-from typing import Any, Dict, Union
+from typing import Any, Coroutine, Dict, Union
+
+try:
+    # 선택 의존성 (pip install crypto-dashboard[speedups]): 설치되어 있으면 더 빠른 JSON 직렬화 사용
+    import orjson
+except ImportError:
+    orjson = None
 
 # 전역 브로드캐스트 관련 변수들 (main 모듈에서 공유)
 clients = set()
-log_cache = []
+# 새로 접속하는 클라이언트에게 다시 보낼 최근 로그 (재직렬화하지 않도록 JSON 문자열로만 보관)
+LOG_CACHE_SIZE = 1000
+log_cache = deque(maxlen=LOG_CACHE_SIZE)
 
 # 전역 broadcast 함수들
 broadcast_message = None
@@ -17,6 +28,10 @@ broadcast_orders_update = None
 broadcast_log = None
 
 
+# 짧게 끝나는 브로드캐스트 태스크를 즉시 시작하는 태스크 팩토리 (Python 3.12+, 이전 버전은 None)
+_eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+
+
 def init_broadcast_functions(broadcast_msg_func, broadcast_orders_func, broadcast_log_func):
     """broadcast 함수들 초기화"""
     global broadcast_message, broadcast_orders_update, broadcast_log
@@ -25,24 +40,47 @@ def init_broadcast_functions(broadcast_msg_func, broadcast_orders_func, broadcas
     broadcast_log = broadcast_log_func
 
 
+def _json_default(value):
+    """JSON 기본 타입이 아닌 값 변환 (Decimal은 정밀도를 유지하도록 문자열로 전송)"""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_message(message) -> str:
+    """메시지를 JSON 문자열로 직렬화합니다. (ws.send_json의 dumps로도 사용)"""
+    if orjson is not None:
+        # json.dumps와 동일하게 문자열이 아닌 dict 키(ccxt 응답의 숫자 키 등)도 허용
+        return orjson.dumps(message, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(message, default=_json_default)
+
+
 async def basic_broadcast_message(message):
     """모든 연결된 클라이언트에게 메시지를 전송합니다."""
+    if not clients:
+        return
+
+    # 클라이언트마다 직렬화하지 않고 한 번만 직렬화하여 전송
+    await _send_to_clients(dumps_message(message))
+
+
+async def _send_to_clients(data: str):
+    """이미 직렬화된 메시지를 모든 연결된 클라이언트에게 전송합니다."""
     for ws in list(clients):
         try:
-            await ws.send_json(message)
+            await ws.send_str(data)
         except ConnectionResetError:
             logging.warning(f"Failed to send message to a disconnected client.")
 
 
 async def basic_broadcast_orders_update(exchange):
     """모든 클라이언트에게 현재 주문 목록을 전송합니다."""
-    orders_with_exchange = []
-    for order in exchange.order_manager.orders_cache.values():
-        order_copy = order.copy()
-        order_copy['exchange'] = exchange.name
-        orders_with_exchange.append(order_copy)
-
-    update_message = {'type': 'orders_update', 'data': orders_with_exchange}
+    # 거래소 이름은 주문마다 복사해 넣지 않고 메시지에 한 번만 포함 (프론트엔드에서 각 주문에 설정)
+    update_message = {
+        'type': 'orders_update',
+        'exchange': exchange.name,
+        'data': list(exchange.order_manager.orders_cache.values())
+    }
     await basic_broadcast_message(update_message)
 
 
@@ -54,13 +92,20 @@ async def basic_broadcast_log(message, exchange_name=None, exchange_logger=None)
         'timestamp': datetime.now(timezone.utc).isoformat(),
         'exchange': exchange_name
     }
-    log_cache.append(log_message)
-
     # Use exchange-specific logger if available, otherwise use root logger
     log_logger = exchange_logger if exchange_logger else logging.getLogger()
     log_logger.info(f"LOG: {message}")
 
-    await basic_broadcast_message(log_message)
+    # 로그는 한 번만 직렬화하여 캐시와 전송에 함께 사용
+    # (직렬화할 수 없는 로그는 호출한 쪽의 처리를 막지 않도록 기록만 남기고 건너뜀)
+    try:
+        data = dumps_message(log_message)
+    except (TypeError, ValueError) as e:
+        log_logger.error(f"Failed to serialize log message: {e}")
+        return
+    log_cache.append(data)
+
+    await _send_to_clients(data)
 
 
 def get_clients():
@@ -69,5 +114,16 @@ def get_clients():
 
 
 def get_log_cache():
-    """로그 캐시 반환"""
-    return log_cache
\ No newline at end of file
+    """로그 캐시 반환 (JSON 문자열로 직렬화된 최근 로그)"""
+    return log_cache
+
+
+def create_broadcast_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    앱이 보내는 일회성 브로드캐스트 태스크를 생성합니다.
+    Python 3.12+에서는 첫 await까지 즉시 실행하여, 클라이언트가 없거나 바로 전송되는 경우
+    이벤트 루프를 한 번 더 거치지 않고 완료됩니다. (루프 전체의 태스크 팩토리는 바꾸지 않음)
+    """
+    if _eager_task_factory is not None:
+        return _eager_task_factory(asyncio.get_running_loop(), coro)
+    return asyncio.create_task(coro)
@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional, Set, List, TYPE_CHECKING
 import logging
 
 from ...protocols import Balances
+from ..broadcast import create_broadcast_task
 from .exchange_utils import calculate_average_buy_price
 
 if TYPE_CHECKING:
@@ -24,6 +25,9 @@ class BalanceManager:
         self.testnet = coordinator.testnet
         self.whitelist = coordinator.whitelist
 
+        # 잔고 이벤트마다 사용하는 브로드캐스트 함수 (app은 시작 시 한 번만 구성됨)
+        self._broadcast_message = self.app['broadcast_message']
+
         # 캐시 데이터 초기화
         self.balances_cache: Dict[str, Dict[str, Any]] = {}
 
@@ -128,7 +132,7 @@ class BalanceManager:
             
             balance_data = self.balances_cache.get(asset, {})
             update_message = self.create_portfolio_update_message(asset, balance_data)
-            asyncio.create_task(self.app['broadcast_message'](update_message))
+            create_broadcast_task(self._broadcast_message(update_message))
         
         # follow 목록에 없으면 캐시에서 완전히 제거
         else:
@@ -136,7 +140,7 @@ class BalanceManager:
             del self.balances_cache[asset]
             
             remove_message = {'type': 'remove_holding', 'symbol': f"{asset}/{self.quote_currency}", 'exchange': self.name}
-            asyncio.create_task(self.app['broadcast_message'](remove_message))
+            create_broadcast_task(self._broadcast_message(remove_message))
 
         # 추적 자산 목록 업데이트 및 감시 루프 재시작 요청
         asyncio.create_task(self.coordinator.update_tracked_assets_and_restart_watcher())
@@ -165,8 +169,9 @@ class BalanceManager:
 
     def update_price(self, asset: str, price: Decimal) -> None:
         """자산 가격 업데이트"""
-        if asset in self.balances_cache and price > 0:
-            self.balances_cache[asset]['price'] = price
+        balance_info = self.balances_cache.get(asset)
+        if balance_info is not None and price > 0:
+            balance_info['price'] = price
 
     async def update_average_price_on_buy(self, asset: str, filled_amount: Decimal, average_price: Decimal) -> None:
         """매수 체결 후 평균 매수 단가를 업데이트합니다."""
@@ -208,7 +213,7 @@ class BalanceManager:
 
         # 업데이트된 잔고 정보 브로드캐스트
         update_message = self.create_portfolio_update_message(asset, balances)
-        await self.app['broadcast_message'](update_message)
+        await self._broadcast_message(update_message)
 
     async def update_realized_pnl_on_sell(self, asset: str, filled_amount: Decimal, average_price: Decimal) -> None:
         """매도 체결 후 실현 손익을 업데이트합니다."""
@@ -241,14 +246,14 @@ class BalanceManager:
 
         # 업데이트된 잔고 정보 브로드캐스트
         update_message = self.create_portfolio_update_message(asset, balances)
-        await self.app['broadcast_message'](update_message)
+        await self._broadcast_message(update_message)
 
     def update_unrealised_pnl(self, asset: str, current_price: Decimal) -> Optional[Decimal]:
         """미실현 손익을 계산하고 캐시를 업데이트합니다."""
-        if asset not in self.balances_cache:
+        balances = self.balances_cache.get(asset)
+        if balances is None:
             return None
 
-        balances = self.balances_cache[asset]
         avg_buy_price = balances.get('avg_buy_price')
         total_amount = balances.get('total_amount', Decimal('0'))
 
@@ -2,6 +2,8 @@ import asyncio
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from ..broadcast import create_broadcast_task
+
 if TYPE_CHECKING:
     from ...exchange_coordinator import ExchangeCoordinator
 
@@ -19,6 +21,9 @@ class EventHandler:
         self.balance_manager = coordinator.balance_manager
         self.order_manager = coordinator.order_manager
 
+        # 잔고 이벤트마다 사용하는 브로드캐스트 함수 (app은 시작 시 한 번만 구성됨)
+        self._broadcast_message = coordinator.app['broadcast_message']
+
     async def watch_balance_loop(self) -> None:
         """잔고 업데이트 감시 루프"""
         while True:
@@ -53,7 +58,7 @@ class EventHandler:
                         updated_balance = self.balance_manager.balances_cache.get(asset)
                         if updated_balance:
                             message = self.balance_manager.create_portfolio_update_message(asset, updated_balance)
-                            asyncio.create_task(self.coordinator.app['broadcast_message'](message))
+                            create_broadcast_task(self._broadcast_message(message))
 
                 # watch_balance가 단일 자산 변경을 반환하는 경우 (e.g. binance)
                 elif 'asset' in balance_update:
@@ -71,7 +76,7 @@ class EventHandler:
                     updated_balance = self.balance_manager.balances_cache.get(asset)
                     if updated_balance:
                         message = self.balance_manager.create_portfolio_update_message(asset, updated_balance)
-                        asyncio.create_task(self.coordinator.app['broadcast_message'](message))
+                        create_broadcast_task(self._broadcast_message(message))
 
             except asyncio.CancelledError:
                 self.logger.info(f"Balance watch loop for {self.name} cancelled.")
@@ -3,11 +3,28 @@ Exchange Factory Module
 This module is responsible for creating and configuring ccxt exchange instances.
 It adapts exchange-specific methods to a standardized interface.
 """
+import aiohttp
 import ccxt.pro as ccxt
 from typing import Any, Dict, Optional
 
 from ...protocols import ExchangeProtocol
 
+def _get_market_id(exchange: ExchangeProtocol, symbol: str) -> str:
+    """
+    Returns the exchange-specific market id for a symbol.
+    The id never changes for a symbol, so it is cached on the exchange instance
+    to skip the market() lookup and validation on every order.
+    """
+    market_ids: Optional[Dict[str, str]] = getattr(exchange, '_market_id_cache', None)
+    if market_ids is None:
+        market_ids = {}
+        setattr(exchange, '_market_id_cache', market_ids)
+
+    market_id = market_ids.get(symbol)
+    if market_id is None:
+        market_id = market_ids[symbol] = exchange.market(symbol)['id']
+    return market_id
+
 async def _binance_create_oco_order(self: ExchangeProtocol, symbol: str, side: str, amount: float, price: Optional[float], stop_price: Optional[float], stop_limit_price: Optional[float] = None, params: Dict[str, Any] = {}) -> Dict[str, Any]:
     """
     Standardized OCO order creation method for Binance.
@@ -21,7 +38,7 @@ async def _binance_create_oco_order(self: ExchangeProtocol, symbol: str, side: s
 
     # Binance API requires the symbol without '/'
     api_params = {
-        'symbol': self.market(symbol)['id'],
+        'symbol': _get_market_id(self, symbol),
         'side': side.upper(),
         'quantity': float(self.amount_to_precision(symbol, amount)),
         'price': float(self.price_to_precision(symbol, price)),
@@ -40,12 +57,20 @@ async def _binance_create_oco_order(self: ExchangeProtocol, symbol: str, side: s
     # The implicit method name for POST /api/v3/order/oco
     return await self.private_post_order_oco(api_params)
 
-def get_exchange(exchange_name: str, api_key: str, api_secret: str) -> ExchangeProtocol:
+def get_exchange(exchange_name: str, api_key: str, api_secret: str,
+                 session: Optional[aiohttp.ClientSession] = None) -> ExchangeProtocol:
     """
     Creates a ccxt exchange instance and attaches standardized methods.
+    If a session is given, the exchange uses it instead of creating its own
+    (ccxt then leaves closing the session to the caller).
     """
     exchange_class = getattr(ccxt, exchange_name)
-    exchange: ExchangeProtocol = exchange_class({'apiKey': api_key, 'secret': api_secret})
+    # ccxt's built-in throttler is a token bucket driven by the exchange's documented rateLimit.
+    # Enable it explicitly so concurrent REST calls (e.g. the ticker fallback fetches) are spaced out.
+    exchange_config: Dict[str, Any] = {'apiKey': api_key, 'secret': api_secret, 'enableRateLimit': True}
+    if session is not None:
+        exchange_config['session'] = session
+    exchange: ExchangeProtocol = exchange_class(exchange_config)
 
     # Attach exchange-specific standardized methods
     if exchange_name == 'binance':
@@ -29,13 +29,37 @@ async def calculate_average_buy_price(
 
         sorted_trades = sorted(trade_history, key=get_timestamp)
 
+        # 매도 이력이 없으면 역방향 한 번의 순회로 평단가를 계산 (실현 손익은 0)
+        if not any(trade.get('side') == 'sell' for trade in sorted_trades):
+            running_amount = current_amount
+            total_cost = Decimal('0')
+            total_amount_bought = Decimal('0')
+
+            for trade in reversed(sorted_trades):
+                if trade.get('side') != 'buy':
+                    continue
+                filled = Decimal(str(trade.get('filled', '0')))
+                price = Decimal(str(trade.get('price', '0')))
+
+                total_cost += filled * price
+                total_amount_bought += filled
+                running_amount -= filled
+
+                if running_amount == Decimal('0'):
+                    return total_cost / total_amount_bought, Decimal('0')
+
+            return None, None
+
         running_amount = current_amount
-        start_index = -1
+        # 역방향 순회에서 변환한 (side, filled, trade)를 보관하여 정방향 계산에서 재사용
+        # 매도가 섞이면 누적 보유량이 단조 증가하지 않아 이분 탐색을 쓸 수 없고,
+        # 가장 최근의 0 지점에서 멈추는 역방향 순회가 최근 거래만 확인하므로 더 저렴함
+        position_records = []
 
-        for i in range(len(sorted_trades) - 1, -1, -1):
-            trade = sorted_trades[i]
+        for trade in reversed(sorted_trades):
             side = trade.get('side')
             filled = Decimal(str(trade.get('filled', '0')))
+            position_records.append((side, filled, trade))
 
             if side == 'sell':
                 running_amount += filled
@@ -43,20 +67,15 @@ async def calculate_average_buy_price(
                 running_amount -= filled
 
             if running_amount == Decimal('0'):
-                start_index = i
                 break
-
-        if start_index == -1:
+        else:
             return None, None
 
         total_cost = Decimal('0')
         total_amount_bought = Decimal('0')
         realised_pnl = Decimal('0')
 
-        for i in range(start_index, len(sorted_trades)):
-            trade = sorted_trades[i]
-            side = trade.get('side')
-            filled = Decimal(str(trade.get('filled', '0')))
+        for side, filled, trade in reversed(position_records):
             price = Decimal(str(trade.get('price', '0')))
 
             if side == 'buy':
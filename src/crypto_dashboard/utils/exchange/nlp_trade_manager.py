@@ -1,4 +1,4 @@
-from dataclasses import asdict, is_dataclass
+import asyncio
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from ...utils.nlp.entity_extractor import EntityExtractor
@@ -10,6 +10,18 @@ if TYPE_CHECKING:
     from ...exchange_coordinator import ExchangeCoordinator
 
 
+class _NlpExchangeView:
+    """TradeCommandParser에 필요한 거래소 인터페이스 (PriceManager와 OrderManager 직접 주입)"""
+    __slots__ = ('exchange', 'quote_currency', 'balances_cache', 'price_manager', 'order_manager')
+
+    def __init__(self, exchange, quote_currency, balances_cache, price_manager, order_manager):
+        self.exchange = exchange
+        self.quote_currency = quote_currency
+        self.balances_cache = balances_cache
+        self.price_manager = price_manager
+        self.order_manager = order_manager
+
+
 class NlpTradeManager:
     """NLP 트레이딩 관리를 전담하는 서비스 클래스"""
 
@@ -49,25 +61,15 @@ class NlpTradeManager:
             # NLP 컴포넌트 초기화 (리팩토링: PriceManager/OrderManager 직접 사용)
             extractor = EntityExtractor(self.coins, updated_nlptrade_config, self.logger)
 
-            # TradeCommandParser에 필요한 인터페이스를 제공하는 mock 객체 생성
-            # - PriceManager와 OrderManager 직접 주입
-            class MockExchangeBase:
-                def __init__(self, exchange, quote_currency, balances_cache, price_manager, order_manager):
-                    self.exchange = exchange  # type: ignore
-                    self.quote_currency = quote_currency  # type: ignore
-                    self.balances_cache = balances_cache  # type: ignore
-                    self.price_manager = price_manager  # 리팩토링 추가
-                    self.order_manager = order_manager   # 리팩토링 추가
-
             # coordinator를 통해 PriceManager, OrderManager, BalanceManager 주입
-            nlp_exchange_mock = MockExchangeBase(
+            nlp_exchange_view = _NlpExchangeView(
                 self.exchange,
                 self.quote_currency,
                 self.coordinator.balance_manager.balances_cache,
                 self.coordinator.price_manager,
                 self.coordinator.order_manager
             )
-            self.parser = TradeCommandParser(extractor, nlp_exchange_mock, self.logger)
+            self.parser = TradeCommandParser(extractor, nlp_exchange_view, self.logger)
             self.logger.info(f"NLP trader initialized successfully for {self.name}.")
 
         except Exception as e:
@@ -78,52 +80,81 @@ class NlpTradeManager:
         """NLP 컴포넌트가 준비되었는지 확인"""  # executor 제거 (리팩토링)
         return self.parser is not None
 
+    def _get_cached_price(self, asset: str) -> Optional[float]:
+        """잔고 캐시에 저장된 자산의 현재가를 반환합니다. 없으면 None을 반환합니다."""
+        balance_entry = self.coordinator.balance_manager.balances_cache.get(asset)
+        if balance_entry is not None:
+            cached_price = balance_entry.get('price')
+            if cached_price and cached_price > 0:
+                return float(cached_price)
+        return None
+
+    async def _fetch_last_price(self, symbol: str) -> Optional[float]:
+        """Ticker API로 현재가를 조회합니다. 실패 시 None을 반환합니다."""
+        try:
+            self.logger.debug(f"Fetching ticker for untracked asset: {symbol}")
+            ticker = await self.exchange.fetch_ticker(symbol)
+            if ticker and 'last' in ticker and ticker['last'] is not None:
+                price = float(ticker['last'])
+                self.logger.debug(f"Successfully fetched price for {symbol}: {price}")
+                return price
+            self.logger.warning(f"Could not find 'last' price in ticker for {symbol}")
+        except Exception as e:
+            # API 조회 실패 시 콘솔에만 에러를 기록하고 계속 진행
+            self.logger.error(f"Failed to fetch ticker for {symbol}, proceeding without price info: {e}")
+        return None
+
     async def parse_command(self, text: str):
         """자연어 텍스트를 파싱하여 거래 의도로 변환하고, 현재가를 추가하여 최종 거래 명령을 생성합니다."""
         if not self.parser:
             raise ValueError(f"NLP parser not available for exchange: {self.name}")
 
-        intent_result = await self.parser.parse(text)
+        # 캐시에 가격이 없는 코인이면 파싱(호가/현재가 조회 포함)과 동시에 현재가를 미리 조회
+        prefetch_symbol = None
+        prefetch_task = None
+        # 추출 결과는 캐시되므로 이어지는 parser.parse는 같은 결과를 다시 추출하지 않고 재사용
+        early_coin = self.parser.extractor.extract_entities(text).get('coin')
+        if early_coin and self._get_cached_price(early_coin) is None:
+            prefetch_symbol = f"{early_coin}/{self.quote_currency}"
+            prefetch_task = asyncio.create_task(self._fetch_last_price(prefetch_symbol))
 
-        # TradeIntent 객체가 아니면 (예: 에러 메시지) 그대로 반환
-        if not isinstance(intent_result, TradeIntent):
-            return intent_result
+        try:
+            intent_result = await self.parser.parse(text)
+
+            # TradeIntent 객체가 아니면 (예: 에러 메시지) 그대로 반환
+            if not isinstance(intent_result, TradeIntent):
+                return intent_result
 
-        self.logger.info(f"Parsed trade intent: {intent_result}")
+            self.logger.info(f"Parsed trade intent: {intent_result}")
 
-        # 현재가 정보 가져오기
-        current_price = None
-        if intent_result.symbol:
-            asset = intent_result.symbol.split('/')[0]
-            
-            # 1. 추적 중인 자산인지 확인 (캐시 우선)
-            if asset in self.coordinator.balance_manager.balances_cache:
-                cached_price = self.coordinator.balance_manager.balances_cache[asset].get('price')
-                if cached_price and cached_price > 0:
-                    current_price = float(cached_price)
+            # 현재가 정보 가져오기
+            current_price = None
+            if intent_result.symbol:
+                asset = intent_result.symbol.partition('/')[0]
+
+                # 1. 추적 중인 자산인지 확인 (캐시 우선)
+                current_price = self._get_cached_price(asset)
+                if current_price is not None:
                     self.logger.debug(f"Using cached price for {asset}: {current_price}")
 
-            # 2. 캐시에 없으면 API로 조회
-            if current_price is None:
-                try:
-                    self.logger.debug(f"Fetching ticker for untracked asset: {intent_result.symbol}")
-                    ticker = await self.exchange.fetch_ticker(intent_result.symbol)
-                    if ticker and 'last' in ticker and ticker['last'] is not None:
-                        current_price = float(ticker['last'])
-                        self.logger.debug(f"Successfully fetched price for {intent_result.symbol}: {current_price}")
-                    else:
-                        self.logger.warning(f"Could not find 'last' price in ticker for {intent_result.symbol}")
-                except Exception as e:
-                    # API 조회 실패 시 콘솔에만 에러를 기록하고 계속 진행
-                    self.logger.error(f"Failed to fetch ticker for {intent_result.symbol}, proceeding without price info: {e}")
-
-        # TradeIntent와 현재가 정보를 결합하여 TradeCommand 객체 생성
-        trade_command = TradeCommand(
-            **asdict(intent_result),
-            current_price=current_price
-        )
-        
-        return trade_command
+                # 2. 캐시에 없으면 미리 시작한 조회 결과를 사용하거나 API로 조회
+                elif prefetch_task is not None and intent_result.symbol == prefetch_symbol:
+                    current_price = await prefetch_task
+                else:
+                    current_price = await self._fetch_last_price(intent_result.symbol)
+
+            # TradeIntent와 현재가 정보를 결합하여 TradeCommand 객체 생성
+            trade_command = TradeCommand(
+                **intent_result.to_dict(),
+                current_price=current_price
+            )
+
+            return trade_command
+
+        finally:
+            # 사용되지 않은 선행 조회는 취소
+            if prefetch_task is not None and not prefetch_task.done():
+                prefetch_task.cancel()
 
 
     async def execute_command(self, command):
@@ -1,7 +1,7 @@
 import asyncio
-import json
+import time
 from decimal import Decimal
-from typing import Any, Dict, Set, TYPE_CHECKING, Optional
+from typing import Any, Coroutine, Dict, Set, TYPE_CHECKING, Optional
 
 from ...models.trade_models import TradeCommand
 from ...protocols import ExchangeProtocol
@@ -14,6 +14,13 @@ class OrderManager:
     """주문 관리를 전담하는 서비스 클래스"""
     exchange: ExchangeProtocol
 
+    # 최근 초기 가격을 조회한 자산은 이 시간(초) 동안 fetch_ticker를 다시 호출하지 않음
+    RECENT_PRICE_TTL = 30.0
+    # 전체 취소 시 동시에 보내는 취소 요청 수 (거래소 rate limit 초과 방지)
+    CANCEL_CONCURRENCY = 10
+    # 주문 목록 브로드캐스트를 모으는 시간(초) (연속된 주문 이벤트를 한 번의 전송으로 합침)
+    ORDERS_BROADCAST_DELAY = 0.02
+
     def __init__(self, coordinator: "ExchangeCoordinator"):
         self.coordinator = coordinator
         self.exchange = coordinator.exchange
@@ -23,119 +30,270 @@ class OrderManager:
         self.app = coordinator.app
         self.balance_manager = coordinator.balance_manager
 
+        # 주문 이벤트마다 사용하는 브로드캐스트 함수 (app은 시작 시 한 번만 구성됨)
+        self._broadcast_message = self.app['broadcast_message']
+        self._broadcast_log = self.app['broadcast_log']
+        self._broadcast_orders_update = self.app['broadcast_orders_update']
+
         # 캐시 데이터 초기화
         self.orders_cache: Dict[str, Dict[str, Any]] = {}
-        
-        # 설정 파일 로드
-        with open('src/crypto_dashboard/config.json', 'r') as f:
-            self.config = json.load(f)
+        # 자산별 미체결 주문 수 (get_order_asset_names 용 인덱스)
+        self._asset_index: Dict[str, int] = {}
+        # 실행 중인 백그라운드 태스크 참조 유지 (GC로 인한 태스크 소멸 방지)
+        self._background_tasks: Set[asyncio.Task] = set()
+        # 예약된 주문 목록 브로드캐스트 태스크 (전송 전까지의 주문 이벤트가 공유)
+        self._orders_broadcast_task: Optional[asyncio.Task] = None
+        # 자산별 마지막 초기 가격 조회 시각 (time.monotonic 기준)
+        self._recently_priced: Dict[str, float] = {}
+        # 주문별 누적 체결량 (캐시의 float 값과 별도로 체결량 변화를 정확히 계산하기 위해 Decimal로 보관)
+        self._filled_amounts: Dict[str, Decimal] = {}
+        # 주문별 마지막으로 처리한 웹소켓 이벤트의 상태 (중복 이벤트 무시용)
+        self._order_fingerprints: Dict[str, tuple] = {}
+
+        # 거래소 설정 (시작 시 한 번 로드된 app['config']의 해당 거래소 항목을 코디네이터와 공유)
+        self.config = coordinator.config
+        # 스탑 트리거 조건을 (키 경로 튜플, 기대값) 형태로 미리 변환 (주문 이벤트마다 경로를 나누지 않도록)
+        self._stop_trigger_conditions = self._compile_stop_trigger_conditions(self.config.get('stop_trigger_conditions'))
+
+    def _create_background_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """태스크를 생성하고 완료될 때까지 참조를 유지합니다."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _schedule_orders_broadcast(self) -> asyncio.Task:
+        """주문 목록 브로드캐스트를 예약합니다. 이미 예약된 전송이 있으면 그 태스크를 반환합니다."""
+        if self._orders_broadcast_task is None:
+            self._orders_broadcast_task = self._create_background_task(self._flush_orders_broadcast())
+        return self._orders_broadcast_task
+
+    async def _flush_orders_broadcast(self) -> None:
+        """잠시 기다렸다가 그동안 반영된 주문 캐시를 한 번에 브로드캐스트합니다."""
+        await asyncio.sleep(self.ORDERS_BROADCAST_DELAY)
+        # 전송 중에 들어온 이벤트는 새 전송을 예약하도록 먼저 비움
+        self._orders_broadcast_task = None
+        # (app['exchanges'][self.name]은 이 코디네이터 자신이므로 조회 없이 직접 전달)
+        try:
+            await self._broadcast_orders_update(self.coordinator)
+        except Exception as e:
+            self.logger.error(f"Failed to broadcast orders update: {e}")
+
+    def _store_order(self, order_id: str, cached_order: Dict[str, Any]) -> None:
+        """주문을 캐시에 저장하고 자산 인덱스를 갱신합니다."""
+        old_order = self.orders_cache.get(order_id)
+        old_asset = self._cached_order_asset(old_order) if old_order is not None else None
+        asset = cached_order['asset']
+        if old_asset != asset:
+            if old_asset is not None:
+                self._release_asset(old_asset)
+            if asset:
+                self._asset_index[asset] = self._asset_index.get(asset, 0) + 1
+        self.orders_cache[order_id] = cached_order
+
+    def _remove_order(self, order_id: str) -> bool:
+        """주문을 캐시에서 제거하고 자산 인덱스를 갱신합니다. 제거 여부를 반환합니다."""
+        old_order = self.orders_cache.pop(order_id, None)
+        self._order_fingerprints.pop(order_id, None)
+        self._filled_amounts.pop(order_id, None)
+        if old_order is None:
+            return False
+        self._release_asset(self._cached_order_asset(old_order))
+        return True
 
     @staticmethod
-    def _get_nested_value(data: Dict[str, Any], path: str) -> Optional[Any]:
-        """점(.)으로 구분된 경로 문자열을 사용해 중첩된 딕셔너리에서 값을 가져옵니다."""
-        keys = path.split('.')
-        value = data
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return None
-        return value
-
-    def _is_order_triggered(self, order: Dict[str, Any]) -> bool:
-        """설정 파일에 정의된 조건 목록에 따라 스탑 주문이 트리거되었는지 확인합니다."""
-        if not order.get('stopPrice'):
+    def _cached_order_asset(cached_order: Dict[str, Any]) -> str:
+        """캐시된 주문의 자산 이름 ('asset' 필드가 없으면 심볼에서 추출)"""
+        asset = cached_order.get('asset')
+        if asset is None:
+            asset = (cached_order.get('symbol') or '').partition('/')[0]
+        return asset
+
+    def _release_asset(self, asset: str) -> None:
+        """자산 인덱스에서 주문 하나를 차감하고, 남은 주문이 없으면 자산을 제거합니다."""
+        count = self._asset_index.get(asset)
+        if count is None:
+            return
+        if count <= 1:
+            del self._asset_index[asset]
+        else:
+            self._asset_index[asset] = count - 1
+
+    def _is_recently_priced(self, asset: str) -> bool:
+        """RECENT_PRICE_TTL 이내에 초기 가격을 조회한 자산인지 확인합니다. (만료된 기록은 제거)"""
+        priced_at = self._recently_priced.get(asset)
+        if priced_at is None:
             return False
+        if time.monotonic() - priced_at < self.RECENT_PRICE_TTL:
+            return True
+        del self._recently_priced[asset]
+        return False
+
+    def _mark_recently_priced(self, asset: str) -> None:
+        """자산의 초기 가격 조회 시각을 기록합니다. 기록이 계속 쌓이지 않도록 만료된 기록은 함께 제거합니다."""
+        now = time.monotonic()
+        expired = [a for a, priced_at in self._recently_priced.items() if now - priced_at >= self.RECENT_PRICE_TTL]
+        for a in expired:
+            del self._recently_priced[a]
+        self._recently_priced[asset] = now
+
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        """주문 필드 값을 float으로 변환합니다 (None/빈 값은 0.0, 이미 float이면 그대로 반환)."""
+        if value.__class__ is float:
+            return value
+        return float(value) if value else 0.0
+
+    @staticmethod
+    def _to_decimal(value: Any) -> Decimal:
+        """주문 필드 값을 Decimal로 변환합니다 (None/빈 값은 0)."""
+        if isinstance(value, Decimal):
+            return value
+        return Decimal(str(value)) if value else Decimal('0')
 
-        exchange_config = self.config.get('exchanges', {}).get(self.name, {})
-        conditions = exchange_config.get('stop_trigger_conditions')
+    @staticmethod
+    def _first_positive_number(*values: Any) -> Optional[float]:
+        """주어진 값들 중 0보다 큰 첫 번째 수치형 값을 반환합니다."""
+        for value in values:
+            if isinstance(value, (int, float)) and value > 0:
+                return value
+        return None
 
+    @staticmethod
+    def _compile_stop_trigger_conditions(conditions: Any) -> tuple:
+        """설정의 스탑 트리거 조건 목록을 (점(.)으로 나눈 키 튜플, 기대값) 튜플로 변환합니다."""
         # 조건이 리스트 형태가 아니면 처리하지 않음
         if not isinstance(conditions, list):
+            return ()
+
+        return tuple(
+            (tuple(condition['path'].split('.')), condition['expected_value'])
+            for condition in conditions
+            if isinstance(condition, dict) and 'path' in condition and 'expected_value' in condition
+        )
+
+    def _is_order_triggered(self, order: Dict[str, Any]) -> bool:
+        """설정 파일에 정의된 조건 목록에 따라 스탑 주문이 트리거되었는지 확인합니다."""
+        if not order.get('stopPrice'):
             return False
 
-        # 조건 리스트를 순회하며 하나라도 맞으면 True 반환
-        for condition in conditions:
-            if isinstance(condition, dict) and 'path' in condition and 'expected_value' in condition:
-                actual_value = self._get_nested_value(order, condition['path'])
-                if actual_value is not None and actual_value == condition['expected_value']:
-                    return True # 조건 중 하나라도 일치하면 즉시 True 반환
-        
+        # 조건 목록을 순회하며 하나라도 맞으면 True 반환
+        for keys, expected_value in self._stop_trigger_conditions:
+            value: Any = order
+            for key in keys:
+                value = value.get(key) if isinstance(value, dict) else None
+                if value is None:
+                    break
+            if value is not None and value == expected_value:
+                return True # 조건 중 하나라도 일치하면 즉시 True 반환
+
         # 모든 조건이 맞지 않으면 False 반환
         return False
 
+    def _build_cache_entry(self, order: Dict[str, Any], is_triggered: bool) -> Dict[str, Any]:
+        """거래소 주문 데이터로 주문 캐시 항목(프론트엔드 전송용)을 생성합니다."""
+        # 캐시/브로드캐스트 값은 float이므로 float 연산 사용
+        get = order.get
+        symbol = get('symbol') or ''
+        raw_price = self._to_float(get('price'))
+        amount = self._to_float(get('amount'))
+        filled = self._to_float(get('filled'))
+        stop_price_val = get('stopPrice')
+        stop_price = self._to_float(stop_price_val) if stop_price_val is not None else None
+
+        # 유효 가격 결정: 스탑-마켓 주문의 경우 stop_price를 사용
+        effective_price = raw_price
+        if raw_price == 0 and stop_price is not None and stop_price > 0:
+            effective_price = stop_price
+
+        return {
+            'id': get('id'),
+            'symbol': symbol,
+            'asset': symbol.partition('/')[0],
+            'side': get('side'),
+            'price': effective_price, # 프론트엔드로 보낼 가격
+            'stop_price': stop_price,
+            'amount': amount,
+            'filled': filled,
+            'value': effective_price * (amount - filled), # 미체결 수량 기준 가치
+            'timestamp': get('timestamp'),
+            'status': get('status'),
+            'was_stop_order': bool(stop_price and stop_price > 0),  # 스탑 주문 여부 플래그
+            'is_triggered': is_triggered
+        }
+
     async def initialize_orders(self, open_orders: list) -> None:
         """초기 주문 상태 초기화"""
         for order in open_orders:
-            raw_price = Decimal(str(order.get('price') or '0'))
-            amount = Decimal(str(order.get('amount') or '0'))
-            filled = Decimal(str(order.get('filled') or '0'))
-            stop_price_val = order.get('stopPrice')
-            stop_price = Decimal(str(stop_price_val)) if stop_price_val is not None else None
-
-            # 유효 가격 결정: 스탑-마켓 주문의 경우 stop_price를 사용
-            effective_price = raw_price
-            if raw_price == 0 and stop_price is not None and stop_price > 0:
-                effective_price = stop_price
-
             order_id = order.get('id')
             if order_id:
-                self.orders_cache[order_id] = {
-                    'id': order_id,
-                    'symbol': order.get('symbol', ''),
-                    'side': order.get('side'),
-                    'price': float(effective_price), # 프론트엔드로 보낼 가격
-                    'stop_price': float(stop_price) if stop_price is not None else None,
-                    'amount': float(amount),
-                    'filled': float(filled),
-                    'value': float(effective_price * (amount - filled)), # 미체결 수량 기준 가치
-                    'timestamp': order.get('timestamp'),
-                    'status': order.get('status'),
-                    'is_triggered': self._is_order_triggered(order)
-                }
+                self._store_order(order_id, self._build_cache_entry(order, self._is_order_triggered(order)))
+                self._filled_amounts[order_id] = self._to_decimal(order.get('filled'))
         self.logger.info(f"Initialized {len(open_orders)} open orders.")
 
     async def cancel_order(self, order_id: str, symbol: str) -> None:
         """단일 주문 취소"""
         try:
-            await self.app['broadcast_log']({'status': 'Cancelling', 'symbol': symbol, 'order_id': order_id}, self.name, self.logger)
+            await self._broadcast_log({'status': 'Cancelling', 'symbol': symbol, 'order_id': order_id}, self.name, self.logger)
             await self.exchange.cancel_order(order_id, symbol)
             self.logger.info(f"Successfully sent cancel request for order {order_id}")
             # 캐시 제거는 watch_orders 이벤트가 처리하도록 둠
 
         except Exception as e:
             self.logger.error(f"Failed to cancel order {order_id}: {e}")
-            await self.app['broadcast_log']({'status': 'Cancel Failed', 'symbol': symbol, 'order_id': order_id, 'reason': str(e)}, self.name, self.logger)
+            await self._broadcast_log({'status': 'Cancel Failed', 'symbol': symbol, 'order_id': order_id, 'reason': str(e)}, self.name, self.logger)
+
+    async def _cancel_with_limit(self, semaphore: asyncio.Semaphore, order_id: str, symbol: str) -> None:
+        """세마포어를 얻은 뒤에 주문 취소 요청 (cancel_all_orders의 동시 요청 수 제한)"""
+        async with semaphore:
+            await self.exchange.cancel_order(order_id, symbol)
 
     async def cancel_all_orders(self) -> None:
         """모든 주문 취소"""
         self.logger.info("Received request to cancel all orders.")
-        all_orders = list(self.orders_cache.values())
-        if not all_orders:
+        # 취소에 필요한 (주문 ID, 심볼) 쌍만 스냅샷
+        targets = [
+            (order_id, order['symbol'])
+            for order_id, order in self.orders_cache.items()
+            if order_id and order.get('symbol')
+        ]
+        if not targets:
             self.logger.info("No open orders to cancel.")
-            await self.app['broadcast_log']({'status': 'Info', 'message': 'No open orders to cancel.'}, self.name, self.logger)
+            await self._broadcast_log({'status': 'Info', 'message': 'No open orders to cancel.'}, self.name, self.logger)
             return
 
-        await self.app['broadcast_log']({'status': 'Info', 'message': f'Cancelling all {len(all_orders)} orders.'}, self.name, self.logger)
-
-        # 병렬로 모든 주문 취소 요청
-        cancellation_tasks = []
-        for order in all_orders:
-            order_id = order.get('id')
-            symbol = order.get('symbol', '')
-            if order_id and symbol:
-                task = asyncio.create_task(self.exchange.cancel_order(order_id, symbol))
-                cancellation_tasks.append(task)
-
-        results = await asyncio.gather(*cancellation_tasks, return_exceptions=True)
-
-        for order, result in zip(all_orders, results):
-            order_id = order.get('id')
-            if isinstance(result, Exception):
+        await self._broadcast_log({'status': 'Info', 'message': f'Cancelling all {len(targets)} orders.'}, self.name, self.logger)
+
+        # 캐시에 있는 주문만 개별로 취소 (거래소의 심볼 단위 일괄 취소는 이 대시보드 밖에서 넣은
+        # 주문까지 취소하고, 스탑 주문은 건너뛰는 거래소도 있으므로 사용하지 않음)
+        # 동시 요청 수를 제한하여 병렬로 취소 요청하며, 하나의 취소 실패가 나머지 취소 요청을
+        # 중단시키지 않도록 예외를 반환값으로 받음
+        semaphore = asyncio.Semaphore(self.CANCEL_CONCURRENCY)
+        results = await asyncio.gather(
+            *[self._cancel_with_limit(semaphore, order_id, symbol) for order_id, symbol in targets],
+            return_exceptions=True
+        )
+
+        # 주문별 결과를 모아 하나의 요약 로그로 브로드캐스트
+        failed = []
+        succeeded = []
+        for (order_id, symbol), result in zip(targets, results):
+            if isinstance(result, BaseException):
                 self.logger.error(f"Failed to cancel order {order_id}: {result}")
-                await self.app['broadcast_log']({'status': 'Cancel Failed', 'symbol': order.get('symbol'), 'order_id': order_id, 'reason': str(result)}, self.name, self.logger)
+                failed.append({'symbol': symbol, 'order_id': order_id, 'reason': str(result)})
             else:
                 self.logger.info(f"Successfully sent cancel request for order {order_id}")
+                succeeded.append(order_id)
+
+        summary = {
+            'status': 'Cancel Summary',
+            'message': f'{len(succeeded)} cancel requests sent, {len(failed)} failed.',
+            'failed': failed,
+            'succeeded': succeeded
+        }
+        if failed:
+            summary['reason'] = ', '.join(f"{item['order_id']} ({item['symbol']}): {item['reason']}" for item in failed)
+        await self._broadcast_log(summary, self.name, self.logger)
 
     def update_order(self, order: Dict[str, Any]) -> list:
         """주문 업데이트 처리 (웹소켓 이벤트에서 호출)"""
@@ -146,106 +304,107 @@ class OrderManager:
 
         # 이전 주문 정보 가져오기
         old_order = self.orders_cache.get(order_id, {})
-        old_filled = Decimal(str(old_order.get('filled', '0')))
+        is_known_order = order_id in self.orders_cache
 
-        # 새 주문 정보 파싱
+        # 거래소가 같은 상태의 이벤트를 반복해서 보내면 캐시 갱신과 브로드캐스트를 생략
         status = order.get('status')
-        new_filled = Decimal(str(order.get('filled', '0')))
+        is_triggered = self._is_order_triggered(order)
+        # (캐시, 로그, 체결 처리에 쓰이는 필드를 모두 포함하여 이 필드만 바뀐 이벤트도 반영되도록 함)
+        get = order.get
+        fingerprint = (
+            status, get('filled'), get('remaining'), get('price'), get('average'), get('amount'),
+            get('stopPrice'), get('triggerPrice'), get('fee'), is_triggered
+        )
+        if is_known_order and self._order_fingerprints.get(order_id) == fingerprint:
+            return []
+
+        old_assets = set(self._asset_index)
+        # 잔고/손익 계산용 체결량은 float 오차가 섞이지 않도록 거래소 값을 Decimal로 변환하여 계산
+        # (이전 체결량이 보관되어 있지 않으면 캐시된 값 사용)
+        old_filled = self._filled_amounts.get(order_id)
+        if old_filled is None:
+            old_filled = self._to_decimal(old_order.get('filled'))
+
+        symbol = order.get('symbol', '')
+        asset = symbol.partition('/')[0] if symbol else ''
+        new_filled = self._to_decimal(order.get('filled'))
 
         # 체결량 변화 감지
-        trade_amount = new_filled - old_filled
-        if trade_amount > 0:
-            tasks.append(asyncio.create_task(self._handle_filled_order(order, trade_amount)))
+        trade_amount = Decimal('0')
+        if new_filled > old_filled:
+            trade_amount = new_filled - old_filled
+            tasks.append(self._create_background_task(self._handle_filled_order(order, trade_amount, asset)))
 
         # 캐시 업데이트 및 브로드캐스트
         if status in ('closed', 'canceled'):
-            if order_id in self.orders_cache:
-                del self.orders_cache[order_id]
+            order_opened_or_closed = self._remove_order(order_id)
+            if order_opened_or_closed:
                 self.logger.info(f"Order {order_id} ({status}) removed from cache.")
         else: # open (partially filled 포함)
-            raw_price = Decimal(str(order.get('price') or '0'))
-            amount = Decimal(str(order.get('amount') or '0'))
-            stop_price_val = order.get('stopPrice')
-            stop_price = Decimal(str(stop_price_val)) if stop_price_val is not None else None
-
-            # 유효 가격 결정: 스탑-마켓 주문의 경우 stop_price를 사용
-            effective_price = raw_price
-            if raw_price == 0 and stop_price is not None and stop_price > 0:
-                effective_price = stop_price
-            
-            self.orders_cache[order_id] = {
-                'id': order_id,
-                'symbol': order.get('symbol', ''),
-                'side': order.get('side'),
-                'price': float(effective_price), # 프론트엔드로 보낼 가격
-                'stop_price': float(stop_price) if stop_price is not None else None,
-                'amount': float(amount),
-                'filled': float(new_filled),
-                'value': float(effective_price * (amount - new_filled)),
-                'timestamp': order.get('timestamp'),
-                'status': status,
-                'was_stop_order': bool(stop_price and stop_price > 0),  # 스탑 주문 여부 플래그
-                'is_triggered': self._is_order_triggered(order)
-            }
-
-        # 프론트엔드에 주문 목록 업데이트 브로드캐스트
-        tasks.append(asyncio.create_task(self.app['broadcast_orders_update'](self.app['exchanges'].get(self.name))))
-
-        # 로그 브로드캐스트
+            order_opened_or_closed = not is_known_order
+            self._store_order(order_id, self._build_cache_entry(order, is_triggered))
+            self._filled_amounts[order_id] = new_filled
+            self._order_fingerprints[order_id] = fingerprint
+
+        # 로그 브로드캐스트 (JSON 직렬화가 바로 가능하도록 str/float/None 값만 사용)
+        # broadcast_log는 메시지를 log_cache에 보관하고 기록 시 한 번 직렬화하여 전송하므로 dict 형태를 유지하되,
+        # 항상 포함되는 키는 한 번의 리터럴로 구성
         log_payload = {
             'status': status,
             'symbol': order.get('symbol'),
             'side': order.get('side'),
             'order_id': order_id,
-            'price': float(order.get('average') or order.get('price') or '0'),
-            'amount': float(trade_amount if trade_amount > 0 else order.get('amount', '0'))
+            'price': self._to_float(order.get('average') or order.get('price')),
+            'amount': float(trade_amount) if trade_amount > 0 else self._to_float(order.get('amount')),
+            'order_type': order.get('type')  # 실제 주문 유형(limit/market)
         }
 
         # 스탑 주문 여부 확인 및 로그에 반영
-        # 두 줄로 분할하여 None 안전하게 처리
-        stop_price_in_order = order.get('stopPrice')
-        trigger_price_in_order = order.get('triggerPrice')
-        old_stop_price = old_order.get('stop_price')
-
         # 수치형 값에 대해 0보다 큰지만 확인 (0.0도 스탑 주문으로 취급하지 않음)
-        current_stop_price = None
-        if stop_price_in_order and isinstance(stop_price_in_order, (int, float)) and stop_price_in_order > 0:
-            current_stop_price = stop_price_in_order
-        elif trigger_price_in_order and isinstance(trigger_price_in_order, (int, float)) and trigger_price_in_order > 0:
-            current_stop_price = trigger_price_in_order
-        elif old_stop_price and isinstance(old_stop_price, (int, float)) and old_stop_price > 0:
-            current_stop_price = old_stop_price
-
-        was_stop_order = ((stop_price_in_order is not None and isinstance(stop_price_in_order, (int, float)) and stop_price_in_order > 0) or
-                          (trigger_price_in_order is not None and isinstance(trigger_price_in_order, (int, float)) and trigger_price_in_order > 0) or
-                          old_order.get('was_stop_order', False))
-
-        # 1. 실제 주문 유형(limit/market)을 먼저 설정
-        log_payload['order_type'] = order.get('type')
-
-        # 2. 스탑 가격이 존재하고, 주문 상태가 'open'일 때만 payload에 추가
+        order_stop_price = self._first_positive_number(order.get('stopPrice'), order.get('triggerPrice'))
+        current_stop_price = order_stop_price or self._first_positive_number(old_order.get('stop_price'))
+        was_stop_order = order_stop_price is not None or old_order.get('was_stop_order', False)
+
+        # 스탑 가격이 존재하고, 주문 상태가 'open'일 때만 payload에 추가
         if status == 'open' and (current_stop_price or was_stop_order):
             if current_stop_price:
-                log_payload['stop_price'] = float(current_stop_price)
-            log_payload['is_triggered'] = self._is_order_triggered(order)
+                log_payload['stop_price'] = self._to_float(current_stop_price)
+            log_payload['is_triggered'] = is_triggered
 
         # 수수료 정보 추가
         if 'fee' in order and order['fee'] is not None:
             log_payload['fee'] = order['fee']
             
-        tasks.append(asyncio.create_task(self.app['broadcast_log'](log_payload, self.name, self.logger)))
+        # 주문 자산 목록이 바뀌었거나 주문이 생성/종료된 경우에만 추적 자산 갱신 요청
+        # (부분 체결 등 단순 갱신으로 감시 루프를 재확인하지 않도록 함)
+        refresh_tracked_assets = order_opened_or_closed or self._asset_index.keys() != old_assets
 
-        # 주문 상태 변경이 추적 자산 목록에 영향을 줄 수 있으므로, 코디네이터에 업데이트 요청
-        tasks.append(asyncio.create_task(self.coordinator.update_tracked_assets_and_restart_watcher()))
+        # 주문 목록/로그 브로드캐스트와 추적 자산 갱신을 하나의 태스크로 처리
+        tasks.append(self._create_background_task(self._process_order_event(log_payload, refresh_tracked_assets)))
 
         return tasks
 
+    async def _process_order_event(self, log_payload: Dict[str, Any], refresh_tracked_assets: bool = True) -> None:
+        """주문 이벤트의 후속 작업을 순차적으로 실행합니다. 한 단계의 실패가 다음 단계를 막지 않습니다."""
+        # 프론트엔드에 주문 목록 업데이트 브로드캐스트 예약 (연속된 이벤트는 한 번의 전송으로 합쳐짐)
+        # 전송을 기다리지 않고 로그와 추적 자산 갱신을 바로 진행 (태스크 참조는 _background_tasks가 유지)
+        self._schedule_orders_broadcast()
+
+        # 로그 브로드캐스트
+        try:
+            await self._broadcast_log(log_payload, self.name, self.logger)
+        except Exception as e:
+            self.logger.error(f"Failed to broadcast order log: {e}")
+
+        # 주문 상태 변경이 추적 자산 목록에 영향을 줄 수 있으므로, 코디네이터에 업데이트 요청
+        if refresh_tracked_assets:
+            await self.coordinator.update_tracked_assets_and_restart_watcher()
+
 
-    async def _handle_filled_order(self, order: Dict[str, Any], trade_amount: Decimal):
+    async def _handle_filled_order(self, order: Dict[str, Any], trade_amount: Decimal, asset: str):
         """체결된 주문을 처리하여 잔고 및 손익을 업데이트합니다."""
         side = order.get('side')
         symbol = order.get('symbol')
-        asset = symbol.split('/')[0] if symbol else None
 
         # 체결 가격 (average가 있으면 사용, 없으면 price 사용)
         trade_price = Decimal(str(order.get('average') or order.get('price') or '0'))
@@ -256,7 +415,10 @@ class OrderManager:
 
         # 매수로 인해 새로운 자산을 보유하게 되었는지 확인
         is_new_holding = side == 'buy' and asset not in self.balance_manager.balances_cache
-        if is_new_holding and symbol:
+        # 연속된 부분 체결 등으로 방금 가격을 조회한 자산이면 다시 조회하지 않음
+        # 가격 감시 루프 등으로 이미 가격을 브로드캐스트한 자산도 조회하지 않음
+        if (is_new_holding and symbol and not self._is_recently_priced(asset)
+                and self.coordinator.price_manager.get_cached_price(asset) is None):
             self.logger.info(f"New asset '{asset}' acquired. Fetching initial price before updating balance.")
             try:
                 # 가격 정보를 먼저 조회하고 브로드캐스트
@@ -265,6 +427,7 @@ class OrderManager:
                 percentage = ticker.get('percentage', 0.0)
                 
                 if price is not None:
+                    self._mark_recently_priced(asset)
                     price_update_message = {
                         'type': 'price_update',
                         'exchange': self.name,
@@ -272,7 +435,7 @@ class OrderManager:
                         'price': float(price),
                         'percentage': float(percentage)
                     }
-                    await self.app['broadcast_message'](price_update_message)
+                    await self._broadcast_message(price_update_message)
                     self.logger.info(f"Broadcasted initial price for new holding '{asset}': {price}")
             except Exception as e:
                 self.logger.warning(f"Could not fetch initial price for new holding {symbol}: {e}")
@@ -286,7 +449,7 @@ class OrderManager:
 
     def get_order_asset_names(self) -> Set[str]:
         """주문에서 자산 이름들을 추출"""
-        return {o['symbol'].split('/')[0] for o in self.orders_cache.values() if o.get('symbol')}
+        return set(self._asset_index)
 
     async def execute_trade_command(self, command: TradeCommand) -> Dict[str, Any]:
         """TradeCommand를 받아 주문 생성 및 실행 (TradeExecutor의 execute 리팩토링)"""
@@ -297,12 +460,14 @@ class OrderManager:
 
         try:
             symbol = command.symbol
-            asset = symbol.split('/')[0]
+            asset = symbol.partition('/')[0]
 
             # 새로운 코인인지 확인
             is_new_coin = asset not in self.coordinator.tracked_assets
 
-            if is_new_coin:
+            # 방금 가격을 조회했거나 이미 가격을 알고 있는 코인이면 다시 조회하지 않음
+            if (is_new_coin and not self._is_recently_priced(asset)
+                    and self.coordinator.price_manager.get_cached_price(asset) is None):
                 self.logger.info(f"New coin '{asset}' detected. Fetching price before creating order.")
                 try:
                     # 가격 정보를 먼저 조회하고 브로드캐스트
@@ -311,6 +476,7 @@ class OrderManager:
                     percentage = ticker.get('percentage', 0.0)
                     
                     if price is not None:
+                        self._mark_recently_priced(asset)
                         price_update_message = {
                             'type': 'price_update',
                             'exchange': self.name,
@@ -318,7 +484,7 @@ class OrderManager:
                             'price': float(price),
                             'percentage': float(percentage)
                         }
-                        await self.app['broadcast_message'](price_update_message)
+                        await self._broadcast_message(price_update_message)
                         self.logger.info(f"Broadcasted initial price for new coin '{asset}': {price}")
                 except Exception as e:
                     self.logger.warning(f"Could not fetch initial price for {symbol}: {e}. Proceeding with order creation.")
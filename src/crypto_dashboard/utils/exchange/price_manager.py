@@ -1,6 +1,11 @@
 import asyncio
+import time
 from decimal import Decimal
-from typing import Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, TYPE_CHECKING, Tuple, Union
+
+from ccxt.base.types import Ticker
+
+from ..broadcast import get_clients
 
 if TYPE_CHECKING:
     from ...exchange_coordinator import ExchangeCoordinator
@@ -9,6 +14,11 @@ if TYPE_CHECKING:
 class PriceManager:
     """가격 관리를 전담하는 서비스 클래스"""
 
+    # 일괄 조회 실패 시 개별 가격 조회를 동시에 보내는 최대 요청 수 (거래소 rate limit 초과 방지)
+    FETCH_CONCURRENCY = 10
+    # 캐시된 가격을 신뢰하는 최대 시간(초). 감시 루프가 멈추거나 재시작되면 이후에는 실시간 조회로 대체
+    CACHED_PRICE_TTL = 10.0
+
     def __init__(self, coordinator: "ExchangeCoordinator"):
         self.coordinator = coordinator
         self.exchange = coordinator.exchange
@@ -18,6 +28,17 @@ class PriceManager:
         self.app = coordinator.app
         self.balance_manager = coordinator.balance_manager
 
+        # 가격 이벤트마다 사용하는 브로드캐스트 함수 (app은 시작 시 한 번만 구성됨)
+        self._broadcast_message = self.app['broadcast_message']
+        # 연결된 클라이언트 집합 (접속/종료 시 같은 집합이 갱신됨)
+        self._clients = get_clients()
+        # watch_tickers 한 번의 결과를 price_updates 메시지 하나로 묶어 전송 (false면 심볼별 price_update 전송)
+        self._batch_price_updates = coordinator.config.get('batch_price_updates', True)
+        # 추적 심볼 -> 자산 이름 (가격 감시 루프가 시작될 때 갱신)
+        self._symbol_to_asset: Dict[str, str] = {}
+        # 심볼별 마지막으로 브로드캐스트한 가격과 기록 시각 (time.monotonic 기준)
+        self._last_prices: Dict[str, Tuple[float, float]] = {}
+
     async def initialize_prices_for_tracked_assets(self, tracked_assets: set) -> None:
         """추적중인 모든 자산들의 가격 초기화 (배치 조회)"""
         assets_to_fetch = [a for a in tracked_assets if a != self.quote_currency]
@@ -30,67 +51,104 @@ class PriceManager:
         try:
             tickers = await self.exchange.fetch_tickers(symbols)
             for symbol, ticker in tickers.items():
-                asset = symbol.split('/')[0]
+                asset = symbol.partition('/')[0]
                 price = ticker.get('last')
                 if price is not None:
-                    await self._update_asset_price(asset, symbol, Decimal(str(price)))
+                    await self._update_asset_price(asset, symbol, price)
         except Exception as e:
             self.logger.warning(f"Batch fetch_tickers failed: {e}. Falling back to individual fetches.")
-            for asset in assets_to_fetch:
-                try:
-                    symbol = f"{asset}/{self.quote_currency}"
-                    ticker = await self.exchange.fetch_ticker(symbol)
-                    price = ticker.get('last')
-                    if price is not None:
-                        await self._update_asset_price(asset, symbol, Decimal(str(price)))
-                except Exception as e_single:
-                    self.logger.warning(f"Failed to fetch price for {asset}: {e_single}")
+            # 개별 조회를 동시 요청 수를 제한하여 병렬로 수행
+            semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+
+            async def fetch_one(symbol: str) -> Ticker:
+                async with semaphore:
+                    return await self.exchange.fetch_ticker(symbol)
+
+            results = await asyncio.gather(*(fetch_one(symbol) for symbol in symbols), return_exceptions=True)
+            for asset, symbol, result in zip(assets_to_fetch, symbols, results):
+                if isinstance(result, Exception):
+                    self.logger.warning(f"Failed to fetch price for {asset}: {result}")
+                    continue
+                price = result.get('last')
+                if price is not None:
+                    await self._update_asset_price(asset, symbol, price)
 
-    async def _update_asset_price(self, asset: str, symbol: str, price: Decimal, ticker: Optional[Dict] = None) -> None:
-        """자산 가격 업데이트 및 브로드캐스트"""
+    async def _update_asset_price(self, asset: str, symbol: str, price: float, ticker: Optional[Dict] = None,
+                                  batch: Optional[List[Dict]] = None) -> None:
+        """자산 가격 업데이트 및 브로드캐스트 (price는 ccxt가 반환한 값 그대로 전달, batch가 주어지면 전송 대신 추가)"""
         if price <= 0:
             return
 
-        # 1. 미실현 손익 계산 및 캐시 업데이트 (이제 자릿수 정리까지 포함)
-        unrealised_pnl = self.balance_manager.update_unrealised_pnl(asset, price)
+        # 1. 보유 자산이라면 미실현 손익 계산 및 백엔드 내부 캐시 가격 업데이트
+        #    (손익 계산에 필요한 보유 자산만 Decimal로 변환)
+        unrealised_pnl = None
+        if asset in self.balance_manager.balances_cache:
+            price_decimal = Decimal(str(price))
+            unrealised_pnl = self.balance_manager.update_unrealised_pnl(asset, price_decimal)
+            self.balance_manager.update_price(asset, price_decimal)
 
         # 2. 모든 추적 자산에 대해 price_update 메시지를 항상 전송합니다.
+        await self._broadcast_price_update(symbol, float(price), ticker, unrealised_pnl, batch)
+
+    async def _broadcast_price_update(self, symbol: str, price: float, ticker: Optional[Dict] = None,
+                                      unrealised_pnl: Optional[Decimal] = None,
+                                      batch: Optional[List[Dict]] = None) -> None:
+        """price_update 메시지 브로드캐스트 (batch가 주어지면 메시지 대신 업데이트 항목만 추가)"""
+        # 마지막 가격은 클라이언트가 없어도 기록 (get_cached_price에서 사용)
+        self._last_prices[symbol] = (price, time.monotonic())
+
+        # 연결된 클라이언트가 없으면 메시지를 만들지 않음
+        if not self._clients:
+            return
+
         percentage = 0.0
         if ticker is not None:
             percentage_raw = ticker.get('percentage')
             if percentage_raw is not None:
                 percentage = float(percentage_raw)
 
-        update_message = {
-            'type': 'price_update',
-            'exchange': self.name,
+        update = {
             'symbol': symbol,
-            'price': float(price),
+            'price': price,
             'percentage': percentage,
             'unrealised_pnl': str(unrealised_pnl) if unrealised_pnl is not None else None
         }
-        await self.app['broadcast_message'](update_message)
+        if batch is not None:
+            batch.append(update)
+            return
 
-        # 3. 만약 보유 자산이라면, 백엔드 내부 캐시에도 가격을 업데이트합니다.
-        if asset in self.balance_manager.balances_cache:
-            self.balance_manager.update_price(asset, price)
+        await self._broadcast_message({'type': 'price_update', 'exchange': self.name, **update})
 
     async def watch_tickers_loop(self, symbols: List[str]) -> None:
         """가격 실시간 감시 루프"""
         self.logger.info(f"Starting ticker watch for: {symbols}")
+        # 추적 목록이 바뀌어 감시 루프가 재시작될 때 심볼 -> 자산 매핑을 새로 구성
+        symbol_to_asset = self._symbol_to_asset = {symbol: symbol.partition('/')[0] for symbol in symbols}
+        # 더 이상 추적하지 않는 심볼의 가격은 오래된 값이므로 제거
+        self._last_prices = {
+            symbol: entry for symbol, entry in self._last_prices.items()
+            if symbol in symbol_to_asset
+        }
         while True:
             try:
                 tickers = await self.exchange.watch_tickers(symbols)
+                batch: Optional[List[Dict]] = [] if self._batch_price_updates else None
                 for symbol, ticker in tickers.items():
                     price = ticker.get('last')
                     if price is None:
                         continue
-                    
-                    asset = symbol.split('/')[0]
+
+                    asset = symbol_to_asset.get(symbol)
+                    if asset is None:
+                        # 구독 목록에 없던 심볼이면 한 번만 계산하여 매핑에 추가
+                        asset = symbol_to_asset[symbol] = symbol.partition('/')[0]
                     if not asset:
                         continue
 
-                    await self._update_asset_price(asset, symbol, Decimal(str(price)), ticker)
+                    await self._update_asset_price(asset, symbol, price, ticker, batch)
+
+                if batch:
+                    await self._broadcast_message({'type': 'price_updates', 'exchange': self.name, 'updates': batch})
 
             except asyncio.CancelledError:
                 self.logger.info("Ticker watch loop cancelled.")
@@ -107,6 +165,26 @@ class PriceManager:
             if asset != self.quote_currency
         ]
 
+    def get_cached_price(self, asset: str) -> Optional[Decimal]:
+        """네트워크 조회 없이 알고 있는 자산 가격을 반환 (잔고 캐시 우선, 없으면 마지막 브로드캐스트 가격)
+
+        CACHED_PRICE_TTL보다 오래된 가격은 None을 반환하여 호출자가 실시간 조회하도록 합니다.
+        """
+        last_entry = self._last_prices.get(f"{asset}/{self.quote_currency}")
+        if last_entry is None:
+            return None
+        last_price, recorded_at = last_entry
+        # 잔고 캐시 가격도 같은 가격 업데이트에서 갱신되므로 함께 만료로 취급
+        if time.monotonic() - recorded_at >= self.CACHED_PRICE_TTL:
+            return None
+
+        balance_info = self.balance_manager.balances_cache.get(asset)
+        if balance_info is not None:
+            cached_price = balance_info.get('price')
+            if cached_price and cached_price > 0:
+                return cached_price
+        return Decimal(str(last_price))
+
     async def get_current_price(self, coin_symbol: str) -> Optional[Decimal]:
         """코드 최적화: 캐시 우선 조회, 실패 시 실시간 fetch"""
         # 1. 잔고 캐시에서 가격 우선 확인 (최적화)
@@ -123,10 +201,9 @@ class PriceManager:
             ticker = await self.exchange.fetch_ticker(market_symbol)
             price = ticker.get('last')
             if price is not None:
-                price_decimal = Decimal(str(price))
                 # 조회한 가격을 캐시에 업데이트하여 향후 활용
-                await self._update_asset_price(coin_symbol, market_symbol, price_decimal)
-                return price_decimal
+                await self._update_asset_price(coin_symbol, market_symbol, price)
+                return Decimal(str(price))
             return None
         except Exception as e:
             self.logger.error(f"Could not fetch price for {market_symbol}: {e}")
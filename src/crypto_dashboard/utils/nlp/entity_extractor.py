@@ -7,7 +7,51 @@ from decimal import Decimal, InvalidOperation
 import logging
 import re
 from typing import Any, Dict, List, Optional
-from ..text_utils import clean_text, sanitize_input, expand_k_suffix
+from ..text_utils import clean_text, expand_k_suffix
+
+# 호출마다 정규식 캐시를 조회하지 않도록 고정 패턴은 모듈 로드 시 한 번만 컴파일
+_EN_INTENT_RE = re.compile(r'\b(buy|sell)\b')
+_INTENT_WORDS_RE = re.compile(r'\b(?:buy|sell)\b', re.IGNORECASE)
+_AMOUNT_UNIT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*개')
+_AMOUNT_UNIT_MASK_RE = re.compile(r'\b\d+(?:\.\d+)?\s*개\b')
+_SIGNED_DIGIT_RE = re.compile(r'[+-]\d')
+_SIGNED_NUMBER_RE = re.compile(r'[+-]\d+(?:\.\d+)?')
+_PERCENT_RE = re.compile(r'\d+\s*(?:%|퍼센트)')
+_PRICE_WITH_E_RE = re.compile(r'(?<![+-])\b(\d+(?:\.\d+)?)\s*(?:원|달러|usdt)?에', re.IGNORECASE)
+_REMAINING_NUMBER_RE = re.compile(r'(?<![+-])\b(\d+(?:\.\d+)?)\b')
+_EN_COST_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:usdt|dollar|krw|won)\b')
+_EN_COST_MASK_RE = re.compile(r'\d+(?:\.\d*)?\s*(?:usdt|dollar|krw|won)\b', re.IGNORECASE)
+_KO_COST_EOCHI_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:원|달러|usdt)어치', re.IGNORECASE)
+_KO_COST_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:원|달러|usdt)(?!\s*에)', re.IGNORECASE)
+_KO_COST_MASK_RE = re.compile(r'\b\d+(?:\.\d+)?\s*(?:원|달러|usdt)\s*어치\b', re.IGNORECASE)
+_LIMIT_WORD_RE = re.compile(r'\blimit\b')
+_EN_STOP_MASK_RE = re.compile(r'stop\s+[+-]?\d+\.?\d*\s*%?', re.IGNORECASE)
+_KO_STOP_MASK_RE = re.compile(r'(?:stop|스탑|스탑가|스톱|스톱가)\s+[+-]?\d+\.?\d*\s*%?', re.IGNORECASE)
+_EN_RELATIVE_PRICE_RE = re.compile(r'([+-]\d+(?:\.\d+)?)\s*%?')
+_KO_RELATIVE_PRICE_RE = re.compile(r'([+-]\d+(?:\.\d+)?)\s*(%|퍼센트)?\s*에?')
+_EN_PERCENT_AMOUNT_RE = re.compile(r'![+-](\d+(?:\.\d+)?)\s*%')
+_KO_PERCENT_AMOUNT_RE = re.compile(r'(?<![+-])(\d+\.?\d*)\s*(%|퍼센트)(?!에)')
+_STOP_PRICE_RE = re.compile(r'(?:stop|스탑|스탑가|스톱|스톱가)\s+(?![+-])(\d+\.?\d*)', re.IGNORECASE)
+_RELATIVE_STOP_PRICE_RE = re.compile(r'(?:stop|스탑|스탑가|스톱|스톱가)\s+([+-]\d+\.?\d*)\s*%?', re.IGNORECASE)
+_SIGN_PREFIX_RE = re.compile(r'^[+-]')
+_NUMBER_TOKEN_RE = re.compile(r'^\d+\.?\d*$')
+
+
+def _compile_oco_pattern(stop_keyword: str, limit_keyword: str) -> re.Pattern:
+    """'stop <가격> limit <가격>' 형태의 OCO 패턴 컴파일 (k/m 접미사와 퍼센트 허용)"""
+    price_value_pattern = r'[+-]?\d*\.?\d+%?k?m?'
+    # 숫자와 키워드 사이에 '가격', '원' 같은 단어가 올 수 있도록 .*? 허용
+    return re.compile(
+        rf'{stop_keyword}\s+({price_value_pattern})\s*.*?{limit_keyword}\s+({price_value_pattern})',
+        re.IGNORECASE,
+    )
+
+
+# 영문 여부 -> OCO 패턴
+_OCO_PATTERNS = {
+    True: _compile_oco_pattern(r'stop', r'limit'),
+    False: _compile_oco_pattern(r'(?:스탑|스탑가|스톱|스톱가)', r'(?:지정|지정가)'),
+}
 
 
 class EntityExtractor:
@@ -15,19 +59,36 @@ class EntityExtractor:
     자연어 텍스트에서 거래 관련 엔티티(의도, 코인, 수량, 가격 등)를 추출합니다.
     정규식과 키워드 매칭을 사용하여 사용자 요청의 핵심 구성 요소를 식별합니다.
     """
+    ENTITIES_CACHE_SIZE = 256
+
     def __init__(self, coins: List[str], config: Dict[str, Any], logger: logging.Logger):
         self.coins: List[str] = coins
         self.intent_map: Dict[str, str] = config.get("intent_map", {})
         self.custom_mapping: Dict[str, str] = config.get("custom_mapping", {})
         self.quote_currency: str = config.get("quote_currency", "USDT")
         self.logger = logger
+        # 별칭 검색 시 긴 별칭이 먼저 매칭되도록 한 번만 정렬해 둠
+        self._sorted_custom_keys: List[str] = sorted(self.custom_mapping.keys(), key=len, reverse=True)
         self._update_max_coin_len()
 
     def _update_max_coin_len(self):
+        """코인 목록에서 파생되는 값(최대 코인 길이, 심볼 조회용 집합, 코인 기반 정규식)을 갱신"""
+        self.max_coin_len = max(map(len, self.coins), default=12)  # 코인이 없으면 기본값 12
+        self._coin_set = set(self.coins)
+        # 추출 결과는 코인 목록에 의존하므로 목록이 바뀌면 캐시도 비움
+        self._entities_cache: Dict[str, Dict[str, Any]] = {}
+        self._symbol_re = re.compile(rf'\b[A-Z0-9]{{2,{self.max_coin_len}}}(?![A-Z0-9])')
+
+        # "숫자 코인이름" 패턴 (코인 목록이 바뀔 때만 다시 컴파일)
+        self._amount_coin_re: Optional[re.Pattern] = None
+        self._amount_coin_mask_re: Optional[re.Pattern] = None
         if self.coins:
-            self.max_coin_len = max(len(c) for c in self.coins) if self.coins else 12
-        else:
-            self.max_coin_len = 12  # 기본값
+            coin_pattern = '|'.join(re.escape(coin) for coin in self.coins)
+            self._amount_coin_re = re.compile(rf'(\d+(?:\.\d+)?)\s*({coin_pattern})\b', re.IGNORECASE)
+            # 마스킹은 긴 코인 이름이 먼저 매칭되도록 정렬
+            sorted_coins = sorted(self.coins, key=len, reverse=True)
+            sorted_coin_pattern = '|'.join(re.escape(coin) for coin in sorted_coins)
+            self._amount_coin_mask_re = re.compile(rf'\b\d+(?:\.\d+)?\s*({sorted_coin_pattern})\b', re.IGNORECASE)
 
     def find_closest_symbol(self, input_symbol: str) -> Optional[str]:
         """입력된 심볼과 가장 유사한 심볼을 찾음"""
@@ -37,7 +98,7 @@ class EntityExtractor:
         # 대문자로 변환하여 일관성 유지
         input_symbol = input_symbol.upper()
 
-        if input_symbol in self.coins:
+        if input_symbol in self._coin_set:
             return input_symbol
         if input_symbol in self.custom_mapping:
             self.logger.info(f"Custom mapping found: {input_symbol} -> {self.custom_mapping[input_symbol]}")
@@ -55,7 +116,7 @@ class EntityExtractor:
         """텍스트에서 거래 의도(매수/매도)를 추출"""
         if is_english:
             # 영문: 정규식으로 buy/sell 추출
-            match = re.search(r'\b(buy|sell)\b', text.lower())
+            match = _EN_INTENT_RE.search(text.lower())
             if match:
                 intent = match.group(1)
                 self.logger.info(f"Intent matched (English): '{intent}'")
@@ -71,8 +132,7 @@ class EntityExtractor:
     def _extract_coin(self, text: str, is_english: bool) -> Optional[str]:
         """텍스트에서 코인 심볼 또는 한글 이름(별칭)을 추출"""
         # 영문/한글 공통: 영문 심볼 패턴으로 모든 잠재적 후보 추출
-        symbol_pattern = rf'\b[A-Z0-9]{{2,{self.max_coin_len}}}(?![A-Z0-9])'
-        potential_symbols_from_text = re.findall(symbol_pattern, text.upper())
+        potential_symbols_from_text = self._symbol_re.findall(text.upper())
 
         # Filter out the quote currency from potential symbols if other symbols exist
         filtered_potential_symbols = [
@@ -92,8 +152,7 @@ class EntityExtractor:
 
         if not is_english:
             # 한글: 커스텀 매핑(별칭) 검색
-            sorted_custom_keys = sorted(self.custom_mapping.keys(), key=len, reverse=True)
-            for coin_name in sorted_custom_keys:
+            for coin_name in self._sorted_custom_keys:
                 if coin_name in text:
                     found_coin = self.find_closest_symbol(coin_name)
                     if found_coin:
@@ -110,15 +169,13 @@ class EntityExtractor:
                 return None  # 영문은 토큰 기반 처리에서 담당
             else:
                 # 한글: "개" 단위로 수량 추출
-                amount_match = re.search(r'(\d+(?:\.\d+)?)\s*개', text)
+                amount_match = _AMOUNT_UNIT_RE.search(text)
                 if amount_match:
                     return Decimal(amount_match.group(1))
 
                 # 한글: "숫자 코인이름" 패턴으로 수량 추출
-                if self.coins:
-                    coin_pattern = '|'.join(re.escape(coin) for coin in self.coins)
-                    pattern = rf'(\d+(?:\.\d+)?)\s*({coin_pattern})\b'
-                    amount_coin_match = re.search(pattern, text, re.IGNORECASE)
+                if self._amount_coin_re is not None:
+                    amount_coin_match = self._amount_coin_re.search(text)
                     if amount_coin_match:
                         return Decimal(amount_coin_match.group(1))
         except InvalidOperation:
@@ -135,7 +192,7 @@ class EntityExtractor:
             else:
                 # 한글:
                 # 상대 가격 패턴(+/- 숫자)이 있으면 일반(지정가) 가격으로 해석하지 않음
-                if re.search(r'[+-]\d', text):
+                if _SIGNED_DIGIT_RE.search(text):
                     return None
 
                 # "원에", "달러에", "usdt에" 패턴으로 가격 추출
@@ -143,36 +200,33 @@ class EntityExtractor:
                     return None
 
                 # 패턴 1: "10000에" 같이 '에'로 끝나는 명시적인 지정가
-                price_match = re.search(r'(?<![+-])\b(\d+(?:\.\d+)?)\s*(?:원|달러|usdt)?에', text, re.IGNORECASE)
+                price_match = _PRICE_WITH_E_RE.search(text)
                 if price_match:
                     return Decimal(price_match.group(1))
 
                 # 패턴 2: '에'가 없는 경우. 수량, 총액, 퍼센트와 관련된 숫자를 제외하고 찾는다.
                 # 퍼센트와 관련된 숫자는 가격이 될 수 없다.
-                if re.search(r'\d+\s*(?:%|퍼센트)', text):
+                if _PERCENT_RE.search(text):
                     return None
 
                 masked_text = text
                 
                 # stop price 관련 부분 마스킹
-                stop_pattern = r'(?:stop|스탑|스탑가|스톱|스톱가)\s+[+-]?\d+\.?\d*\s*%?'
-                masked_text = re.sub(stop_pattern, '', masked_text, flags=re.IGNORECASE)
+                masked_text = _KO_STOP_MASK_RE.sub('', masked_text)
 
                 # 총액 패턴 마스킹 ("10000원어치")
-                masked_text = re.sub(r'\b\d+(?:\.\d+)?\s*(?:원|달러|usdt)\s*어치\b', ' MASKED_COST ', masked_text, re.IGNORECASE)
+                masked_text = _KO_COST_MASK_RE.sub(' MASKED_COST ', masked_text)
 
                 # 수량 패턴 마스킹
                 # "0.2개"
-                masked_text = re.sub(r'\b\d+(?:\.\d+)?\s*개\b', ' MASKED_AMOUNT ', masked_text)
+                masked_text = _AMOUNT_UNIT_MASK_RE.sub(' MASKED_AMOUNT ', masked_text)
 
                 # "0.2 BTC"
-                if self.coins:
-                    sorted_coins = sorted(self.coins, key=len, reverse=True)
-                    coin_pattern = '|'.join(re.escape(coin) for coin in sorted_coins)
-                    masked_text = re.sub(rf'\b\d+(?:\.\d+)?\s*({coin_pattern})\b', ' MASKED_AMOUNT ', masked_text, flags=re.IGNORECASE)
+                if self._amount_coin_mask_re is not None:
+                    masked_text = self._amount_coin_mask_re.sub(' MASKED_AMOUNT ', masked_text)
 
                 # 마스킹된 텍스트에 남아있는 숫자 중 마지막 숫자를 가격으로 간주
-                remaining_numbers = re.findall(r'(?<![+-])\b(\d+(?:\.\d+)?)\b', masked_text)
+                remaining_numbers = _REMAINING_NUMBER_RE.findall(masked_text)
 
                 if remaining_numbers:
                     return Decimal(remaining_numbers[-1])
@@ -186,16 +240,16 @@ class EntityExtractor:
         try:
             if is_english:
                 # 영문: "10 usdt", "10krw" 등 '숫자 + 통화 단위' 패턴으로 추출
-                cost_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:usdt|dollar|krw|won)\b', text.lower())
+                cost_match = _EN_COST_RE.search(text.lower())
                 if cost_match:
                     return Decimal(cost_match.group(1))
             else:
                 # 한글: "어치" 또는 통화 단위로 추출
-                cost_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:원|달러|usdt)어치', text, re.IGNORECASE)
+                cost_match = _KO_COST_EOCHI_RE.search(text)
                 if cost_match:
                     return Decimal(cost_match.group(1))
 
-                cost_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:원|달러|usdt)(?!\s*에)', text, re.IGNORECASE)
+                cost_match = _KO_COST_RE.search(text)
                 if cost_match:
                     return Decimal(cost_match.group(1))
         except InvalidOperation:
@@ -207,9 +261,9 @@ class EntityExtractor:
         if is_english:
             # 영문: 'limit' 주문이면서 명시적인 가격 지정이 없는 경우 True를 반환.
             # Parser에서 최종적으로 price 존재 여부를 확인하여 처리함.
-            if re.search(r'\blimit\b', text.lower()):
+            if _LIMIT_WORD_RE.search(text.lower()):
                 # 상대 가격 지정(e.g. +5%)이 있으면 명시적 가격이 있는 것임
-                if re.search(r'[+-]\d+(?:\.\d+)?', text):
+                if _SIGNED_NUMBER_RE.search(text):
                     return False
                 return True
             return False
@@ -220,16 +274,16 @@ class EntityExtractor:
     def _extract_relative_price(self, text: str, is_english: bool) -> Optional[Decimal]:
         """텍스트에서 상대적 가격을 추출 (stop price가 아닌)"""
         # stop price 부분을 먼저 마스킹
-        masked_text = re.sub(r'stop\s+[+-]?\d+\.?\d*\s*%?', '', text, flags=re.IGNORECASE)
+        masked_text = _EN_STOP_MASK_RE.sub('', text)
         try:
             if is_english:
                 # 영문: "+10%", "-5%" 패턴
-                price_match = re.search(r'([+-]\d+(?:\.\d+)?)\s*%?', masked_text)
+                price_match = _EN_RELATIVE_PRICE_RE.search(masked_text)
                 if price_match:
                     return Decimal(price_match.group(1))
             else:
                 # 한글: "+10%에", "-5.5에" 패턴
-                price_match = re.search(r'([+-]\d+(?:\.\d+)?)\s*(%|퍼센트)?\s*에?', masked_text)
+                price_match = _KO_RELATIVE_PRICE_RE.search(masked_text)
                 if price_match:
                     return Decimal(price_match.group(1))
         except InvalidOperation:
@@ -243,7 +297,7 @@ class EntityExtractor:
             if 'all' in text.lower():
                 return "100.0"
 
-            percentage_match = re.search(r'![+-](\d+(?:\.\d+)?)\s*%', text)
+            percentage_match = _EN_PERCENT_AMOUNT_RE.search(text)
             if percentage_match:
                 return percentage_match.group(1)
         else:
@@ -253,7 +307,7 @@ class EntityExtractor:
             if '절반' in text or '반' in text:
                 return "50.0"
 
-            percentage_match = re.search(r'(?<![+-])(\d+\.?\d*)\s*(%|퍼센트)(?!에)', text)
+            percentage_match = _KO_PERCENT_AMOUNT_RE.search(text)
             if percentage_match:
                 return percentage_match.group(1)
         return None
@@ -263,8 +317,7 @@ class EntityExtractor:
         text = expand_k_suffix(text)
         try:
             # "stop" 키워드 뒤에 오는 숫자 추출 (상대값 패턴이 아닌 경우)
-            stop_pattern = r'(?:stop|스탑|스탑가|스톱|스톱가)\s+(?![+-])(\d+\.?\d*)'
-            match = re.search(stop_pattern, text, re.IGNORECASE)
+            match = _STOP_PRICE_RE.search(text)
             if match:
                 return Decimal(match.group(1))
         except InvalidOperation:
@@ -275,8 +328,7 @@ class EntityExtractor:
         """텍스트에서 상대적 stop 주문 가격을 추출"""
         try:
             # "stop" 키워드 뒤에 오는 상대 가격(+/-) 추출
-            stop_pattern = r'(?:stop|스탑|스탑가|스톱|스톱가)\s+([+-]\d+\.?\d*)\s*%?'
-            match = re.search(stop_pattern, text, re.IGNORECASE)
+            match = _RELATIVE_STOP_PRICE_RE.search(text)
             if match:
                 return Decimal(match.group(1))
         except InvalidOperation:
@@ -296,21 +348,7 @@ class EntityExtractor:
             "relative_stop_limit_price": None,
         }
 
-        if is_english:
-            stop_keyword = r'stop'
-            limit_keyword = r'limit'
-        else:
-            stop_keyword = r'(?:스탑|스탑가|스톱|스톱가)'
-            limit_keyword = r'(?:지정|지정가)'
-
-        # Pattern for the price part, allowing for k/m suffixes and percentages
-        price_value_pattern = r'[+-]?\d*\.?\d+%?k?m?'
-        
-        # The full regex pattern with capturing groups for the prices
-        # Added .*? to allow for optional words like '가격' or '원' between the numbers and keywords
-        oco_pattern = rf'{stop_keyword}\s+({price_value_pattern})\s*.*?{limit_keyword}\s+({price_value_pattern})'
-        
-        match = re.search(oco_pattern, text, re.IGNORECASE)
+        match = _OCO_PATTERNS[is_english].search(text)
 
         if not match:
             return oco_prices
@@ -350,25 +388,19 @@ class EntityExtractor:
         text = expand_k_suffix(text)
         # intent 제거 후 나머지 토큰 추출
         rest_of_text = text
-        keywords_to_remove = ['buy', 'sell'] # 'stop'은 아래에서 별도 처리
-        for keyword in keywords_to_remove:
-            rest_of_text = re.sub(rf'\b{keyword}\b', '', rest_of_text, flags=re.IGNORECASE)
+        rest_of_text = _INTENT_WORDS_RE.sub('', rest_of_text)  # 'stop'은 아래에서 별도 처리
+
+        # 이미 추출된 패턴들 제거 (총액: 10 usdt, 10krw 등)
+        rest_of_text = _EN_COST_MASK_RE.sub('', rest_of_text)
 
-        # 이미 추출된 패턴들 제거 (상대 가격, 총액)
-        patterns_to_remove = [
-            r'\d+(?:\.\d*)?\s*(?:usdt|dollar|krw|won)\b',  # 10 usdt, 10krw 등
-        ]
-        
         # relative_price가 있는 경우, 해당 패턴도 제거
         if entities.get("relative_price") is not None:
             # stop price가 아닌 상대 가격 패턴만 제거
-            masked_for_relative = re.sub(r'stop\s+[+-]?\d+\.?\d*\s*%?', '', text, flags=re.IGNORECASE)
-            relative_match = re.search(r'([+-]\d+(?:\.\d+)?)\s*%?', masked_for_relative)
+            masked_for_relative = _EN_STOP_MASK_RE.sub('', text)
+            relative_match = _EN_RELATIVE_PRICE_RE.search(masked_for_relative)
             if relative_match:
-                patterns_to_remove.append(re.escape(relative_match.group(0)))
-
-        for pattern in patterns_to_remove:
-            rest_of_text = re.sub(pattern, '', rest_of_text, flags=re.IGNORECASE)
+                # 매칭 결과는 부호, 숫자, '%'뿐이므로 정규식 없이 문자열 치환으로 제거
+                rest_of_text = rest_of_text.replace(relative_match.group(0), '')
 
         # 토큰 분석
         tokens = [t for t in rest_of_text.split() if t]
@@ -380,12 +412,12 @@ class EntityExtractor:
                 if token.lower() == 'all':
                     if not entities.get('relative_amount'):
                         entities['relative_amount'] = '100.0'
-                elif '%' in token and not re.match(r'^[+-]', token):
+                elif '%' in token and not _SIGN_PREFIX_RE.match(token):
                     # +나 -로 시작하지 않는 %만 상대 수량으로 처리
                     value = token.replace('%', '')
                     if not entities.get('relative_amount'):
                         entities['relative_amount'] = value
-                elif re.match(r'^\d+\.?\d*$', token):
+                elif _NUMBER_TOKEN_RE.match(token):
                     numbers.append(Decimal(token))
                 else:
                     potential_coins.append(token)
@@ -416,9 +448,21 @@ class EntityExtractor:
 
 
     def extract_entities(self, text: str) -> Dict[str, Any]:
-        """주어진 텍스트에서 거래 관련 모든 엔터티를 통합 추출"""
-        sanitized_text = sanitize_input(clean_text(text))
-        clean_input = sanitized_text
+        """주어진 텍스트에서 거래 관련 모든 엔터티를 통합 추출 (같은 입력은 캐시된 결과의 사본 반환)"""
+        cached = self._entities_cache.get(text)
+        if cached is not None:
+            return dict(cached)
+
+        entities = self._extract_all_entities(text)
+        if len(self._entities_cache) >= self.ENTITIES_CACHE_SIZE:
+            self._entities_cache.clear()
+        self._entities_cache[text] = entities
+        return dict(entities)
+
+    def _extract_all_entities(self, text: str) -> Dict[str, Any]:
+        """캐시를 거치지 않고 텍스트에서 모든 엔터티를 추출"""
+        # 입력 이스케이핑은 명령을 받는 웹 핸들러에서 한 번만 수행하므로 여기서는 정제만 함
+        clean_input = clean_text(text)
         self.logger.info(f"Original text: '{text}', Cleaned text: '{clean_input}'")
 
         # 언어 구분
@@ -439,15 +483,7 @@ class EntityExtractor:
         if oco_prices.get("stop_price") or oco_prices.get("relative_stop_price"):
             entities.update(oco_prices)
             # OCO 패턴이 처리되었으므로, 다른 추출기가 재처리하지 않도록 마스킹
-            if is_english:
-                stop_keyword = r'stop'
-                limit_keyword = r'limit'
-            else:
-                stop_keyword = r'(?:스탑|스탑가|스톱|스톱가)'
-                limit_keyword = r'(?:지정|지정가)'
-            price_value_pattern = r'[+-]?\d*\.?\d+%?k?m?'
-            oco_pattern = rf'{stop_keyword}\s+({price_value_pattern})\s*.*?{limit_keyword}\s+({price_value_pattern})'
-            clean_input = re.sub(oco_pattern, ' OCO_PROCESSED ', clean_input, flags=re.IGNORECASE)
+            clean_input = _OCO_PATTERNS[is_english].sub(' OCO_PROCESSED ', clean_input)
             self.logger.info("OCO prices extracted, masking the pattern for further processing.")
 
         # 각 엔터티 추출 (언어별 로직 적용)
@@ -5,40 +5,65 @@
 """
 from decimal import Decimal, InvalidOperation
 import logging
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from ...models.trade_models import TradeIntent
 from .entity_extractor import EntityExtractor
 
+# parse에서 반복 사용하는 Decimal 상수 (호출마다 문자열에서 생성하지 않도록 모듈 로드 시 한 번만 생성)
+_D_ZERO = Decimal('0')
+_D_ONE = Decimal('1')
+_D_HUNDRED = Decimal('100')
+
+
+def _as_decimal(value) -> Decimal:
+    """이미 Decimal인 값(PriceManager 반환값)은 그대로 사용하고, 그 외의 값만 문자열을 거쳐 변환합니다."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
 
 class TradeCommandParser:
     """
     추출된 엔티티를 파싱하여 최종적이고 검증된 `TradeCommand`를 구성합니다.
     상대 가격 계산, 총 비용을 수량으로 변환, 최종 주문 유형 결정과 같은 복잡한 로직을 처리합니다.
     """
+    # 정밀도 조정 결과 캐시의 최대 항목 수 (초과 시 전체 비움)
+    PRECISION_CACHE_SIZE = 4096
+
     def __init__(self, extractor: EntityExtractor, exchange_base, logger: logging.Logger):  # type: ignore
         self.extractor = extractor
         self.exchange_base = exchange_base
         self.logger = logger
+        # (값 종류, 심볼, 값 문자열) -> 조정된 값 문자열 (마켓 정보 갱신 시 비움)
+        self._precision_cache: Dict[Tuple[str, str, str], str] = {}
 
     def _adjust_precision(self, value: Optional[Decimal], symbol: str, value_type: str) -> Tuple[Optional[Decimal], Optional[str]]:
         """거래소 정밀도에 맞게 값을 조정하고, 실패 시 오류 메시지를 반환합니다."""
         if value is None:
             return None, None
 
+        if value_type not in ('price', 'amount'):
+            return value, None
+
+        # 같은 심볼과 값에 대한 반복 요청은 마켓 정보를 다시 조회하지 않고 캐시된 결과 사용
+        cache_key = (value_type, symbol, str(value))
+        adjusted_str = self._precision_cache.get(cache_key)
+        if adjusted_str is not None:
+            return Decimal(adjusted_str), None
+
         try:
             if value_type == 'price':
                 adjusted_str = self.exchange_base.exchange.price_to_precision(symbol, float(value))
-                return Decimal(adjusted_str), None
-            elif value_type == 'amount':
+            else:
                 adjusted_str = self.exchange_base.exchange.amount_to_precision(symbol, float(value))
-                return Decimal(adjusted_str), None
         except Exception as e:
             error_message = f"{value_type} 정밀도 조정 실패 (심볼: {symbol}, 값: {value}): {e}"
             self.logger.warning(error_message)
             return None, error_message
 
-        return value, None
+        if len(self._precision_cache) >= self.PRECISION_CACHE_SIZE:
+            self._precision_cache.clear()
+        self._precision_cache[cache_key] = adjusted_str
+        return Decimal(adjusted_str), None
 
     async def parse(self, text: str) -> Optional[TradeIntent] | str:
         """주어진 텍스트를 파싱하여 TradeIntent 객체로 변환합니다."""
@@ -65,12 +90,15 @@ class TradeCommandParser:
             try:
                 # 마켓 정보 갱신
                 await self.exchange_base.exchange.load_markets(reload=True)
+                # 정밀도 정보가 바뀌었을 수 있으므로 정밀도 조정 캐시 비움
+                self._precision_cache.clear()
 
                 # 코인 목록 업데이트
                 unique_coins = {market['base'] for market in self.exchange_base.exchange.markets.values() if market.get('active') and market.get('base')}
-                self.extractor.coins = sorted(list(unique_coins))
+                # (추출기는 순서에 의존하지 않으므로 정렬하지 않음)
+                self.extractor.coins = list(unique_coins)
 
-                # 최대 코인 길이 재계산
+                # 최대 코인 길이 및 코인 조회용 집합 재계산
                 self.extractor._update_max_coin_len()
 
                 self.logger.info(f"마켓 정보 갱신 완료. 새로운 코인 목록 크기: {len(self.extractor.coins)}")
@@ -98,6 +126,8 @@ class TradeCommandParser:
         order_type = str(entities["order_type"])
 
         # 상대 가격 처리를 위한 기준 가격 가져오기
+        # (호가는 한 번의 parse에서 한 번만 조회하여 현재가 주문 처리에서도 재사용)
+        order_book = None
         base_price_for_relative = None
         if (entities.get("relative_price") is not None or
                 entities.get("relative_stop_price") is not None or
@@ -106,7 +136,7 @@ class TradeCommandParser:
             if order_book:
                 intent = str(entities["intent"])
                 base_price_num = order_book['bid'] if intent == 'buy' else order_book['ask']
-                base_price_for_relative = Decimal(str(base_price_num))
+                base_price_for_relative = _as_decimal(base_price_num)
             else:
                 error_message = f"'{coin_symbol}'의 호가를 가져올 수 없어 상대 가격 주문을 처리할 수 없습니다."
                 self.logger.error(error_message)
@@ -115,7 +145,7 @@ class TradeCommandParser:
         # 상대 가격 주문 처리
         if entities.get("relative_price") is not None and base_price_for_relative is not None:
             relative_price_percentage = entities["relative_price"]
-            calculated_price = base_price_for_relative * (Decimal('1') + relative_price_percentage / Decimal('100'))
+            calculated_price = base_price_for_relative * (_D_ONE + relative_price_percentage / _D_HUNDRED)
             final_price = calculated_price
             self.logger.info(
                 f"상대 가격 주문: {coin_symbol} 기준가({base_price_for_relative}) 대비 {relative_price_percentage:+}% -> "
@@ -125,7 +155,7 @@ class TradeCommandParser:
         # 상대 스탑 가격 주문 처리
         if entities.get("relative_stop_price") is not None and base_price_for_relative is not None:
             relative_stop_price_percentage = entities["relative_stop_price"]
-            calculated_stop_price = base_price_for_relative * (Decimal('1') + relative_stop_price_percentage / Decimal('100'))
+            calculated_stop_price = base_price_for_relative * (_D_ONE + relative_stop_price_percentage / _D_HUNDRED)
             final_stop_price = calculated_stop_price
             self.logger.info(
                 f"상대 스탑 가격 주문: {coin_symbol} 기준가({base_price_for_relative}) 대비 {relative_stop_price_percentage:+}% -> "
@@ -135,7 +165,7 @@ class TradeCommandParser:
         # 상대 스탑 리밋 가격 주문 처리
         if entities.get("relative_stop_limit_price") is not None and base_price_for_relative is not None:
             relative_stop_limit_price_percentage = entities["relative_stop_limit_price"]
-            calculated_stop_limit_price = base_price_for_relative * (Decimal('1') + relative_stop_limit_price_percentage / Decimal('100'))
+            calculated_stop_limit_price = base_price_for_relative * (_D_ONE + relative_stop_limit_price_percentage / _D_HUNDRED)
             final_stop_limit_price = calculated_stop_limit_price
             self.logger.info(
                 f"상대 스탑 리밋 가격 주문: {coin_symbol} 기준가({base_price_for_relative}) 대비 {relative_stop_limit_price_percentage:+}% -> "
@@ -144,10 +174,11 @@ class TradeCommandParser:
 
         # 암시적 현재가 주문 처리
         elif entities.get("current_price_order") and final_price is None:
-            order_book = await self.exchange_base.price_manager.get_order_book(coin_symbol)
+            if order_book is None:
+                order_book = await self.exchange_base.price_manager.get_order_book(coin_symbol)
             if order_book:
                 price_to_set_num = order_book['bid'] if entities.get("intent") == 'buy' else order_book['ask']
-                price_to_set = Decimal(str(price_to_set_num))
+                price_to_set = _as_decimal(price_to_set_num)
                 final_price = price_to_set
                 self.logger.info(f"암시적 현재가 설정: 지정가 {price_to_set}")
             else:
@@ -159,7 +190,7 @@ class TradeCommandParser:
         if final_price is not None and final_stop_price is not None:
             current_price_num = await self.exchange_base.price_manager.get_current_price(coin_symbol)
             if current_price_num:
-                current_price = Decimal(str(current_price_num))
+                current_price = _as_decimal(current_price_num)
                 intent = str(entities["intent"])
                 if (intent == 'buy' and final_price < current_price and final_stop_price > current_price) or \
                    (intent == 'sell' and final_price > current_price and final_stop_price < current_price):
@@ -185,9 +216,9 @@ class TradeCommandParser:
             if price_to_use is None:
                 price_num = await self.exchange_base.price_manager.get_current_price(coin_symbol)
                 if price_num:
-                    price_to_use = Decimal(str(price_num))
+                    price_to_use = _as_decimal(price_num)
 
-            if price_to_use is not None and price_to_use > Decimal('0'):
+            if price_to_use is not None and price_to_use > _D_ZERO:
                 calculated_amount = total_cost / price_to_use
                 final_amount = calculated_amount
                 quote_currency = self.exchange_base.quote_currency
@@ -204,16 +235,17 @@ class TradeCommandParser:
         relative_amount_str = entities.get("relative_amount")
         if relative_amount_str:
             balance_info = self.exchange_base.balances_cache.get(coin_symbol, {})
-            current_holding = balance_info.get('free', Decimal('0'))
+            current_holding = balance_info.get('free', _D_ZERO)
 
-            if current_holding <= Decimal('0'):
+            if current_holding <= _D_ZERO:
                 error_message = f"상대 수량을 처리할 수 없습니다. '{coin_symbol}'의 보유량이 없습니다."
                 self.logger.warning(error_message)
                 return error_message
 
             try:
-                percentage = Decimal(relative_amount_str)
-                calculated_amount = current_holding * (percentage / Decimal('100'))
+                # 추출기는 문자열을 반환하지만 이미 Decimal이면 다시 생성하지 않음
+                percentage = relative_amount_str if isinstance(relative_amount_str, Decimal) else Decimal(relative_amount_str)
+                calculated_amount = current_holding * (percentage / _D_HUNDRED)
                 final_amount = calculated_amount
                 self.logger.info(
                     f"계산된 수량: {percentage}% of {current_holding} {coin_symbol} -> {calculated_amount}"
@@ -236,7 +268,7 @@ class TradeCommandParser:
         adjusted_stop_limit_price, stop_limit_price_error = self._adjust_precision(final_stop_limit_price, market_symbol, 'price')
         if stop_limit_price_error: return stop_limit_price_error
 
-        if adjusted_amount is not None and adjusted_amount <= Decimal('0'):
+        if adjusted_amount is not None and adjusted_amount <= _D_ZERO:
             error_message = f"계산된 거래 수량이 0 이하({adjusted_amount})이므로 거래를 진행할 수 없습니다."
             self.logger.warning(error_message)
             return error_message
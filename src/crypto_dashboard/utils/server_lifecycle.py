@@ -6,12 +6,35 @@ import asyncio
 import json
 import logging
 import os
-import secrets
+import ssl
+
+import aiohttp
+
 from ..exchange_coordinator import ExchangeCoordinator
 
 
+def _read_json(path: str):
+    """JSON 파일을 읽어 파싱 (이벤트 루프를 막지 않도록 별도 스레드에서 호출)"""
+    with open(path) as f:
+        return json.load(f)
 
 
+def _create_shared_session(config) -> aiohttp.ClientSession:
+    """
+    거래소들이 공유할 HTTP 세션 생성
+    ccxt가 직접 만드는 세션과 같이 certifi 인증서로 SSL을 검증하고,
+    프록시 환경 변수(trust_env)는 설정에서 켠 경우에만 사용 (ccxt 기본값과 동일하게 꺼짐)
+    """
+    import certifi  # ccxt 의존성
+
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            ssl=ssl_context, limit=100, ttl_dns_cache=300, enable_cleanup_closed=True
+        ),
+        trust_env=config.get('aiohttp_trust_env', False)
+    )
+
 
 async def on_startup(app):
     """서버 시작 시 초기화 작업"""
@@ -27,8 +50,7 @@ async def on_startup(app):
     )
 
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config.json')
-    with open(config_path) as f:
-        config = json.load(f)
+    config = await asyncio.to_thread(_read_json, config_path)
 
     # app에 config 저장
     app['config'] = config
@@ -43,6 +65,9 @@ async def on_startup(app):
         logger.error("No exchanges configured in config.json")
         return
 
+    # 모든 거래소가 하나의 HTTP 연결 풀을 공유 (DNS 캐시 및 keep-alive 연결 재사용)
+    app['shared_session'] = _create_shared_session(config)
+
     init_tasks = []
     pending_exchanges = []
 
@@ -71,7 +96,7 @@ async def on_startup(app):
                 logger.warning(f"Please replace placeholder keys in .env for {base_env_name}.")
                 continue
 
-            exchange_instance = ExchangeCoordinator(api_key, secret_key, app, exchange_name)
+            exchange_instance = ExchangeCoordinator(api_key, secret_key, app, exchange_name, app['shared_session'])
 
             init_tasks.append(exchange_instance.get_initial_data())
             pending_exchanges.append(exchange_instance)
@@ -133,4 +158,9 @@ async def on_cleanup(app):
             await exchange.close()
             logger.info(f"{exchange_name} exchange connection closed.")
 
+    # 거래소들이 공유하던 세션은 거래소 종료 후 한 번만 닫음
+    shared_session = app.get('shared_session')
+    if shared_session is not None and not shared_session.closed:
+        await shared_session.close()
+
     logger.info("All background tasks stopped.")
@@ -4,39 +4,77 @@
 import unicodedata
 import re
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
+# 같은 명령 문자열이 반복해서 처리되므로 정제 결과를 캐시 (명령 추출 시 매번 두 함수를 거침)
+_TEXT_CACHE_SIZE = 1024
+
+
+# clean_text에서 제거할 문자: 할당된 문자 중 str.isprintable()이 False인 문자와 BMP 밖의 모든 문자
+# (모듈 로드 시 코드 포인트를 순회하지 않도록 범위를 직접 나열. 미할당 코드 포인트는 제거하지 않음)
+_INVALID_CHARS = re.compile(
+    r'['
+    r'\x00-\x1f\x7f-\xa0'  # 제어 문자 (Cc)와 줄바꿈 없는 공백
+    r'\u00ad\u0600-\u0605\u061c\u06dd\u070f\u0890\u0891\u08e2\u180e'  # 서식 문자 (Cf)
+    r'\u1680\u2000-\u200f\u2028-\u202f\u205f-\u2064\u2066-\u206f\u3000'  # 공백/줄/문단 구분자 (Zs, Zl, Zp)와 서식 문자
+    r'\ud800-\uf8ff'  # 서로게이트 (Cs)와 사용자 정의 영역 (Co)
+    r'\ufeff\ufff9-\ufffb\ufffe\uffff'  # BOM, 행간 주석 문자, 비문자
+    r'\U00010000-\U0010ffff'  # BMP 밖의 문자
+    r']'
+)
+
+# 숫자와 'k'가 붙어있는 경우 (소수점 포함, 대소문자 구분 없음)
+_K_SUFFIX_RE = re.compile(r'(\d+(?:\.\d+)?)\s*k(?![a-zA-Z0-9])', re.IGNORECASE)
+
+
+def _expand_k_match(match: "re.Match[str]") -> str:
+    """expand_k_suffix의 치환 함수: 매칭된 숫자에 1000을 곱한 문자열을 반환"""
+    number_str = match.group(1)
+    # 정수는 Decimal 연산 없이 0을 붙여 변환 (선행 0은 Decimal 결과와 같도록 제거)
+    if '.' not in number_str:
+        integer_str = number_str.lstrip('0')
+        return integer_str + '000' if integer_str else '0'
+
+    try:
+        number = Decimal(number_str) * 1000
+        # 정수로 변환 가능한 경우 정수로, 아니면 소수점으로 표현
+        if number == number.to_integral_value():
+            return str(number.to_integral_value())
+        else:
+            return str(number.normalize())
+    except (InvalidOperation, IndexError):
+        return match.group(0) # 변환 실패 시 원본 문자열 반환
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
 def expand_k_suffix(text: str) -> str:
     """
     숫자 뒤에 붙은 'k'를 1000을 곱한 값으로 변환합니다.
     예: 30k -> 30000, 2.67k -> 2670
+    (엔티티 추출 시 같은 문장에 여러 번 호출되므로 결과를 캐시)
     """
-    def replacer(match):
-        try:
-            number_str = match.group(1)
-            number = Decimal(number_str) * 1000
-            # 정수로 변환 가능한 경우 정수로, 아니면 소수점으로 표현
-            if number == number.to_integral_value():
-                return str(number.to_integral_value())
-            else:
-                return str(number.normalize())
-        except (InvalidOperation, IndexError):
-            return match.group(0) # 변환 실패 시 원본 문자열 반환
-
-    # 숫자와 'k'가 붙어있는 경우 (소수점 포함, 대소문자 구분 없음)
-    return re.sub(r'(\d+(?:\.\d+)?)\s*k(?![a-zA-Z0-9])', replacer, text, flags=re.IGNORECASE)
+    # 'k'가 없는 대부분의 명령은 정규식을 실행하지 않고 그대로 반환
+    if 'k' not in text and 'K' not in text:
+        return text
+    return _K_SUFFIX_RE.sub(_expand_k_match, text)
 
 
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
 def clean_text(text: str) -> str:
     """
     유효하지 않은 Unicode 문자를 제거하거나 대체합니다.
     Unicode 정규화 (NFKC: 호환성 문자 처리)를 수행한 후,
     유효하지 않은 문자(서로게이트 등)를 제거합니다.
     """
-    # 유니코드 정규화 (NFKC: 호환성 문자 처리)
-    text = unicodedata.normalize('NFKC', text)
-    # 유효하지 않은 문자 (surrogate 등) 제거
-    text = ''.join(c for c in text if c.isprintable() and ord(c) < 0x10000)
-    return text
+    if text.isascii():
+        # 출력 가능한 ASCII 문자열은 정규화와 필터링 결과가 원본과 같으므로 그대로 반환
+        if text.isprintable():
+            return text
+    elif not unicodedata.is_normalized('NFKC', text):
+        # 유니코드 정규화 (NFKC: 호환성 문자 처리) - ASCII나 이미 정규화된 문자열은 건너뜀
+        text = unicodedata.normalize('NFKC', text)
+    # 유효하지 않은 문자 (surrogate 등) 제거 - 문자 단위 순회 대신 미리 컴파일한 정규식 사용
+    return _INVALID_CHARS.sub('', text)
 
 
 def sanitize_input(text: str) -> str:
@@ -46,14 +84,31 @@ def sanitize_input(text: str) -> str:
     - 입력 길이 제한
     - 빈 문자는 제거
     """
-    if not isinstance(text, str) or len(text) > 500 or not text.strip():
+    # 문자열이 아닌 값은 캐시 키로 사용할 수 없으므로 캐시를 거치기 전에 거름
+    if not isinstance(text, str):
+        return ""
+    return _sanitize_str(text)
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def _sanitize_str(text: str) -> str:
+    """sanitize_input의 문자열 처리 부분 (결과 캐시)"""
+    if len(text) > 500 or not text.strip():
         return ""
 
-    # HTML 엔터티 이스케이핑
-    text = text.replace('&', '&')
-    text = text.replace('<', '<')
-    text = text.replace('>', '>')
-    text = text.replace('"', '"')
-    text = text.replace("'", '&#x27;')
+    text = text.strip()
+    # HTML 엔터티 이스케이핑 (기존과 같이 작은따옴표만 변환하므로 여러 번 적용해도 결과가 같음)
+    # 대부분의 명령에는 작은따옴표가 없으므로 이 경우 변환 없이 그대로 반환
+    if "'" not in text:
+        return text
+    return text.replace("'", '&#x27;')
 
-    return text.strip()
\ No newline at end of file
+
+def clean_and_sanitize(text: str) -> str:
+    """
+    명령 텍스트 정제의 단일 진입점: clean_text 후 sanitize_input을 적용합니다.
+    두 단계 모두 C 수준 연산(정규식, str.replace)과 결과 캐시를 사용하므로 별도의 융합 루프 없이 차례로 호출합니다.
+    """
+    if not isinstance(text, str):
+        return ""
+    return _sanitize_str(clean_text(text))
@@ -3,16 +3,21 @@
 HTTP 및 WebSocket 핸들러들을 제공합니다.
 """
 import asyncio
-from dataclasses import asdict
 from datetime import datetime, timezone
+from functools import partial
 import json
+import logging
 import os
 import mimetypes
 
 from aiohttp import web
 
 from ..models.trade_models import TradeCommand
-from .text_utils import sanitize_input
+from .auth import get_secret_token
+from .broadcast import dumps_message, get_clients, get_log_cache
+from .text_utils import clean_and_sanitize
+
+logger = logging.getLogger("web")
 
 
 async def health_check_handler(request: web.Request) -> web.Response:
@@ -39,16 +44,90 @@ async def http_handler(request):
     return web.Response(status=404)
 
 
+async def _handle_cancel_orders(send_json, app, coordinator, exchange_name, data) -> None:
+    """선택한 주문들을 취소"""
+    orders_to_cancel = data.get('orders', [])
+    logger.info(f"Received request to cancel {len(orders_to_cancel)} orders on {coordinator.name}.")
+    for order in orders_to_cancel:
+        await coordinator.cancel_order(order['id'], order['symbol'])
+    await app['broadcast_orders_update'](coordinator)
+
+
+async def _handle_cancel_all_orders(send_json, app, coordinator, exchange_name, data) -> None:
+    """모든 주문을 취소"""
+    logger.info(f"Received request to cancel all orders on {coordinator.name}.")
+    await coordinator.cancel_all_orders()
+
+
+async def _handle_nlp_command(send_json, app, coordinator, exchange_name, data) -> None:
+    """자연어 명령을 해석하여 확인용 거래 명령을 전송"""
+    raw_text = data.get('text', '')
+    # 명령 텍스트의 정제와 이스케이핑은 이 경계에서 한 번만 수행 (엔터티 추출기는 다시 이스케이핑하지 않음)
+    text = clean_and_sanitize(raw_text)
+    if not text:
+        await send_json({'type': 'nlp_error', 'message': '잘못된 입력입니다.'})
+        return
+
+    if not coordinator or not coordinator.is_nlp_ready():
+        logger.error(f"NLP not ready for exchange: {exchange_name}")
+        await send_json({'type': 'nlp_error', 'message': f'{exchange_name}의 자연어 처리기가 준비되지 않았습니다.'})
+        return
+
+    result = await coordinator.nlp_trade_manager.parse_command(text)
+    if isinstance(result, TradeCommand):
+        await send_json({
+            'type': 'nlp_trade_confirm',
+            'command': result.to_dict()
+        })
+    elif isinstance(result, str):
+        await send_json({'type': 'nlp_error', 'message': result})
+    else:
+        await send_json({'type': 'nlp_error', 'message': '명령을 해석하지 못했습니다.'})
+
+
+async def _handle_nlp_execute(send_json, app, coordinator, exchange_name, data) -> None:
+    """확인된 거래 명령을 실행"""
+    command_data = data.get('command')
+    if not coordinator or not coordinator.is_nlp_ready():
+        logger.error(f"NLP not ready for exchange: {exchange_name}")
+        await send_json({'type': 'nlp_error', 'message': f'{exchange_name}의 거래 실행기가 준비되지 않았습니다.'})
+        return
+
+    if command_data:
+        # UI 표시용으로 사용된 current_price 필드가 있다면 실제 주문 전에 삭제
+        command_data.pop('current_price', None)
+
+        trade_command = TradeCommand(**command_data)
+        result = await coordinator.nlp_trade_manager.execute_command(trade_command)
+
+        # 실행 결과 확인 후 에러 시 프론트엔드로 전송
+        await app['broadcast_log'](result, coordinator.name, coordinator.logger)
+
+        if result.get('status') == 'error':
+            error_message = result.get('message', '거래 실행 중 알 수 없는 에러가 발생했습니다.')
+            await send_json({'type': 'nlp_error', 'message': f'[{exchange_name.upper()}] {error_message}'})
+
+    else:
+        logger.error("No command data received for nlp_execute")
+        await send_json({'type': 'nlp_error', 'message': '거래 실행 정보가 없습니다.'})
+
+
+# 클라이언트 메시지 타입별 처리 함수
+_MESSAGE_HANDLERS = {
+    'cancel_orders': _handle_cancel_orders,
+    'cancel_all_orders': _handle_cancel_all_orders,
+    'nlp_command': _handle_nlp_command,
+    'nlp_execute': _handle_nlp_execute,
+}
+
+
 async def handle_websocket(request):
     """WebSocket 연결 핸들러"""
-    from .broadcast import get_clients
-
     app = request.app
     clients = get_clients()
     exchanges = {}  # 초기화
 
     token = request.cookies.get("auth_token")
-    from .auth import get_secret_token
     expected_token = get_secret_token()
     if token != expected_token:
         ws = web.WebSocketResponse(heartbeat=25)
@@ -58,9 +137,9 @@ async def handle_websocket(request):
 
     ws = web.WebSocketResponse(heartbeat=25)
     await ws.prepare(request)
+    # 이 연결로 보내는 메시지는 브로드캐스트와 같은 직렬화 함수 사용 (orjson 사용 가능 시 더 빠름)
+    send_json = partial(ws.send_json, dumps=dumps_message)
 
-    import logging
-    logger = logging.getLogger("web")
     logger.info('Client connected.')
     clients.add(ws)
     logger.info(f"Total clients: {len(clients)}")
@@ -68,11 +147,11 @@ async def handle_websocket(request):
     try:
         exchanges = app['exchanges']
         exchange_names = list(exchanges.keys())
-        await ws.send_json({'type': 'exchanges_list', 'data': exchange_names})
+        await send_json({'type': 'exchanges_list', 'data': exchange_names})
 
         # Reference price info - 처음 접속시에만 전송 (가격 상대비율 계산용)
         if app['reference_prices'] and app['reference_time']:
-            await ws.send_json({
+            await send_json({
                 'type': 'reference_price_info',
                 'time': app['reference_time'],
                 'prices': app['reference_prices']
@@ -83,15 +162,18 @@ async def handle_websocket(request):
                 tracked_symbols = exchange.price_manager.get_tracked_symbols()
                 if tracked_symbols:
                     tickers = await exchange.exchange.fetch_tickers(symbols=tracked_symbols)
-                    for symbol, ticker in tickers.items():
-                        price = ticker.get('last')
-                        if price is not None:
-                            await ws.send_json({
-                                'type': 'price_update',
-                                'exchange': exchange_name,
-                                'symbol': symbol,
-                                'price': float(price)
-                            })
+                    # 심볼별로 보내지 않고 price_updates 메시지 하나로 묶어 전송
+                    updates = [
+                        {'symbol': symbol, 'price': float(ticker['last'])}
+                        for symbol, ticker in tickers.items()
+                        if ticker.get('last') is not None
+                    ]
+                    if updates:
+                        await send_json({
+                            'type': 'price_updates',
+                            'exchange': exchange_name,
+                            'updates': updates
+                        })
             except Exception as e:
                 logger.error(f"Failed to fetch initial tickers for {exchange_name}: {e}")
 
@@ -101,7 +183,7 @@ async def handle_websocket(request):
                 'exchange': exchange_name,
                 'follows': list(getattr(exchange, 'follows', []))
             }
-            await ws.send_json(follow_message)
+            await send_json(follow_message)
 
             # value_decimal_places 설정 전송
             exchanges_config = app.get('config', {}).get('exchanges', {})
@@ -112,33 +194,33 @@ async def handle_websocket(request):
                 'value_decimal_places': decimal_places,
                 'quote_currency': exchange.quote_currency
             }
-            await ws.send_json(format_message)
+            await send_json(format_message)
 
             # 잔고 데이터 전송
             for symbol, data in exchange.balance_manager.balances_cache.items():
                 update_message = exchange.balance_manager.create_portfolio_update_message(symbol, data)
-                await ws.send_json(update_message)
+                await send_json(update_message)
 
             # 주문 데이터 전송
             if exchange.order_manager.orders_cache:
-                orders_with_exchange = []
-                for order in exchange.order_manager.orders_cache.values():
-                    order_copy = order.copy()
-                    order_copy['exchange'] = exchange_name
-                    orders_with_exchange.append(order_copy)
-                update_message = {'type': 'orders_update', 'data': orders_with_exchange}
+                # 거래소 이름은 주문마다 복사해 넣지 않고 메시지에 한 번만 포함
+                update_message = {
+                    'type': 'orders_update',
+                    'exchange': exchange_name,
+                    'data': list(exchange.order_manager.orders_cache.values())
+                }
                 try:
-                    await ws.send_json(update_message)
+                    await send_json(update_message)
                 except ConnectionResetError:
                     logger.warning(f"Failed to send initial 'orders_update' to a newly connected client for {exchange_name}.")
 
         # 캐시된 로그 전송
-        from .broadcast import get_log_cache
+        # (로그마다 다시 직렬화하지 않도록 기록 시 직렬화해 둔 문자열을 전송)
         log_cache = get_log_cache()
         if log_cache:
             for log_msg in log_cache:
                 try:
-                    await ws.send_json(log_msg)
+                    await ws.send_str(log_msg)
                 except ConnectionResetError:
                     logger.warning("Failed to send cached logs to a newly connected client.")
                     break
@@ -156,70 +238,14 @@ async def handle_websocket(request):
                     exchange_name = data.get('exchange')
                     if not exchange_name or exchange_name not in exchanges:
                         logger.error(f"Invalid exchange specified or no exchanges initialized. Exchange: {exchange_name}")
-                        if msg_type in ('cancel_orders', 'cancel_all_orders', 'nlp_command', 'nlp_execute'):
+                        if msg_type in _MESSAGE_HANDLERS:
                             continue
 
                     coordinator = exchanges.get(exchange_name)
 
-                    if msg_type == 'cancel_orders':
-                        orders_to_cancel = data.get('orders', [])
-                        logger.info(f"Received request to cancel {len(orders_to_cancel)} orders on {coordinator.name}.")
-                        for order in orders_to_cancel:
-                            await coordinator.cancel_order(order['id'], order['symbol'])
-                        await app['broadcast_orders_update'](coordinator)
-
-                    elif msg_type == 'cancel_all_orders':
-                        logger.info(f"Received request to cancel all orders on {coordinator.name}.")
-                        await coordinator.cancel_all_orders()
-
-                    elif msg_type == 'nlp_command':
-                        raw_text = data.get('text', '')
-                        text = sanitize_input(raw_text)
-                        if not text:
-                            await ws.send_json({'type': 'nlp_error', 'message': '잘못된 입력입니다.'})
-                            continue
-
-                        if not coordinator or not coordinator.is_nlp_ready():
-                            logger.error(f"NLP not ready for exchange: {exchange_name}")
-                            await ws.send_json({'type': 'nlp_error', 'message': f'{exchange_name}의 자연어 처리기가 준비되지 않았습니다.'})
-                            continue
-
-                        result = await coordinator.nlp_trade_manager.parse_command(text)
-                        if isinstance(result, TradeCommand):
-                            await ws.send_json({
-                                'type': 'nlp_trade_confirm',
-                                'command': asdict(result)
-                            })
-                        elif isinstance(result, str):
-                            await ws.send_json({'type': 'nlp_error', 'message': result})
-                        else:
-                            await ws.send_json({'type': 'nlp_error', 'message': '명령을 해석하지 못했습니다.'})
-
-                    elif msg_type == 'nlp_execute':
-                        command_data = data.get('command')
-                        if not coordinator or not coordinator.is_nlp_ready():
-                            logger.error(f"NLP not ready for exchange: {exchange_name}")
-                            await ws.send_json({'type': 'nlp_error', 'message': f'{exchange_name}의 거래 실행기가 준비되지 않았습니다.'})
-                            continue
-
-                        if command_data:
-                            # UI 표시용으로 사용된 current_price 필드가 있다면 실제 주문 전에 삭제
-                            if 'current_price' in command_data:
-                                del command_data['current_price']
-                            
-                            trade_command = TradeCommand(**command_data)
-                            result = await coordinator.nlp_trade_manager.execute_command(trade_command)
-
-                            # 실행 결과 확인 후 에러 시 프론트엔드로 전송
-                            await app['broadcast_log'](result, coordinator.name, coordinator.logger)
-
-                            if result.get('status') == 'error':
-                                error_message = result.get('message', '거래 실행 중 알 수 없는 에러가 발생했습니다.')
-                                await ws.send_json({'type': 'nlp_error', 'message': f'[{exchange_name.upper()}] {error_message}'})
-
-                        else:
-                            logger.error("No command data received for nlp_execute")
-                            await ws.send_json({'type': 'nlp_error', 'message': '거래 실행 정보가 없습니다.'})
+                    handler = _MESSAGE_HANDLERS.get(msg_type)
+                    if handler is not None:
+                        await handler(send_json, app, coordinator, exchange_name, data)
 
                 except json.JSONDecodeError:
                     logger.warning(f"Received non-JSON message: {msg.data}")
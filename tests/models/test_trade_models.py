@@ -0,0 +1,13 @@
+from dataclasses import asdict
+
+from crypto_dashboard.models.trade_models import TradeCommand, TradeIntent
+
+
+def test_to_dict_matches_asdict():
+    """to_dict returns the same mapping, in the same key order, as dataclasses.asdict."""
+    intent = TradeIntent(intent='buy', symbol='BTC/USDT', amount='1', price='90', order_type='limit', is_oco=True)
+    command = TradeCommand(**intent.to_dict(), current_price=100.5)
+
+    for obj in (intent, command):
+        assert obj.to_dict() == asdict(obj)
+        assert list(obj.to_dict()) == list(asdict(obj))
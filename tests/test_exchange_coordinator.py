@@ -0,0 +1,37 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crypto_dashboard.exchange_coordinator import ExchangeCoordinator
+
+
+@pytest.mark.asyncio
+async def test_get_initial_data_closes_exchange_after_all_requests_settle():
+    """Tests that a failed initial request closes the exchange only after the sibling requests finish."""
+    coordinator = ExchangeCoordinator.__new__(ExchangeCoordinator)
+    coordinator.name = "test_exchange"
+    coordinator.logger = MagicMock()
+    coordinator.app = {'config': {}}
+    coordinator.exchange = MagicMock()
+    coordinator.nlp_trade_manager = MagicMock()
+
+    finished = []
+
+    async def slow_fetch_open_orders():
+        await asyncio.sleep(0.01)
+        finished.append('fetch_open_orders')
+        return []
+
+    async def close():
+        assert finished == ['fetch_open_orders']
+
+    coordinator.nlp_trade_manager.initialize = AsyncMock()
+    coordinator.exchange.fetch_balance = AsyncMock(side_effect=Exception("boom"))
+    coordinator.exchange.fetch_open_orders = AsyncMock(side_effect=slow_fetch_open_orders)
+    coordinator.exchange.close = AsyncMock(side_effect=close)
+
+    with pytest.raises(Exception, match="boom"):
+        await coordinator.get_initial_data()
+
+    coordinator.exchange.close.assert_awaited_once()
@@ -0,0 +1,62 @@
+from decimal import Decimal
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+
+from crypto_dashboard.utils.exchange.exchange_utils import calculate_average_buy_price
+
+
+@pytest.fixture
+def mock_exchange():
+    """Creates a mock exchange with an awaitable fetch_closed_orders."""
+    exchange = MagicMock()
+    exchange.fetch_closed_orders = AsyncMock()
+    return exchange
+
+
+@pytest.mark.asyncio
+async def test_average_buy_price_buys_only(mock_exchange):
+    """Only the most recent buys that add up to the current holding are averaged."""
+    mock_exchange.fetch_closed_orders.return_value = [
+        {'side': 'buy', 'filled': '1', 'price': '10', 'timestamp': 1},
+        {'side': 'buy', 'filled': '1', 'price': '20', 'timestamp': 2},
+        {'side': 'buy', 'filled': '1', 'price': '40', 'timestamp': 3},
+    ]
+
+    avg_price, realised_pnl = await calculate_average_buy_price(
+        mock_exchange, 'BTC', Decimal('2'), 'USDT', MagicMock()
+    )
+
+    assert avg_price == Decimal('30')
+    assert realised_pnl == Decimal('0')
+
+
+@pytest.mark.asyncio
+async def test_average_buy_price_buys_only_unmatched_history(mock_exchange):
+    """Returns no average when the buy history cannot explain the current holding."""
+    mock_exchange.fetch_closed_orders.return_value = [
+        {'side': 'buy', 'filled': '1', 'price': '10', 'timestamp': 1},
+    ]
+
+    avg_price, realised_pnl = await calculate_average_buy_price(
+        mock_exchange, 'BTC', Decimal('2'), 'USDT', MagicMock()
+    )
+
+    assert avg_price is None
+    assert realised_pnl is None
+
+
+@pytest.mark.asyncio
+async def test_average_buy_price_with_sell(mock_exchange):
+    """Realised PnL is accumulated from sells after the position was opened."""
+    mock_exchange.fetch_closed_orders.return_value = [
+        {'side': 'buy', 'filled': '2', 'price': '10', 'timestamp': 1},
+        {'side': 'sell', 'filled': '1', 'price': '15', 'timestamp': 2},
+    ]
+
+    avg_price, realised_pnl = await calculate_average_buy_price(
+        mock_exchange, 'BTC', Decimal('1'), 'USDT', MagicMock()
+    )
+
+    assert avg_price == Decimal('10')
+    assert realised_pnl == Decimal('5')
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+
+from crypto_dashboard.models.trade_models import TradeCommand, TradeIntent
+from crypto_dashboard.utils.exchange.nlp_trade_manager import NlpTradeManager
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Creates a mock ExchangeCoordinator with necessary attributes."""
+    coordinator = MagicMock()
+    coordinator.logger = MagicMock()
+    coordinator.name = "test_exchange"
+    coordinator.quote_currency = "USDT"
+    coordinator.balance_manager.balances_cache = {}
+    coordinator.exchange = MagicMock()
+    coordinator.exchange.fetch_ticker = AsyncMock(return_value={'last': 100.0})
+    return coordinator
+
+
+@pytest.fixture
+def nlp_trade_manager(mock_coordinator):
+    """Creates an NlpTradeManager with a mocked parser."""
+    manager = NlpTradeManager(mock_coordinator)
+    manager.parser = MagicMock()
+    manager.parser.extractor.extract_entities = MagicMock(return_value={'coin': 'BTC'})
+    manager.parser.parse = AsyncMock(return_value=TradeIntent(
+        intent='buy', symbol='BTC/USDT', amount='1', price=None, order_type='market'
+    ))
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_parse_command_uses_prefetched_ticker(nlp_trade_manager, mock_coordinator):
+    """Tests that the ticker fetched alongside parsing supplies the current price."""
+    command = await nlp_trade_manager.parse_command("buy 1 btc")
+
+    assert isinstance(command, TradeCommand)
+    assert command.current_price == 100.0
+    mock_coordinator.exchange.fetch_ticker.assert_called_once_with('BTC/USDT')
+    nlp_trade_manager.parser.extractor.extract_entities.assert_called_once_with("buy 1 btc")
+
+
+@pytest.mark.asyncio
+async def test_parse_command_skips_prefetch_for_cached_price(nlp_trade_manager, mock_coordinator):
+    """Tests that no ticker is fetched when the balance cache has a price."""
+    mock_coordinator.balance_manager.balances_cache['BTC'] = {'price': 50.0}
+
+    command = await nlp_trade_manager.parse_command("buy 1 btc")
+
+    assert command.current_price == 50.0
+    mock_coordinator.exchange.fetch_ticker.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_parse_command_refetches_when_symbol_differs(nlp_trade_manager, mock_coordinator):
+    """Tests that a speculative fetch for another symbol is not used."""
+    nlp_trade_manager.parser.extractor.extract_entities.return_value = {'coin': 'ETH'}
+
+    command = await nlp_trade_manager.parse_command("buy 1 btc")
+
+    assert command.current_price == 100.0
+    mock_coordinator.exchange.fetch_ticker.assert_any_call('BTC/USDT')
@@ -15,6 +15,10 @@ def mock_coordinator():
     coordinator.logger = MagicMock()
     coordinator.name = "test_exchange"
     coordinator.quote_currency = "USDT"
+    coordinator.config = {
+        'quote_currency': 'USDT',
+        'stop_trigger_conditions': [{'path': 'info.isWorking', 'expected_value': True}]
+    }
     coordinator.app = {
         'broadcast_message': AsyncMock(),
         'broadcast_orders_update': AsyncMock(),
@@ -25,6 +29,7 @@ def mock_coordinator():
     coordinator.balance_manager.update_average_price_on_buy = AsyncMock()
     coordinator.balance_manager.update_realized_pnl_on_sell = AsyncMock()
     coordinator.update_tracked_assets_and_restart_watcher = AsyncMock()
+    coordinator.price_manager.get_cached_price = MagicMock(return_value=None)
     coordinator.exchange = MagicMock()
     coordinator.exchange.cancel_order = AsyncMock()
     return coordinator
@@ -36,6 +41,12 @@ def order_manager(mock_coordinator):
     return OrderManager(mock_coordinator)
 
 
+async def drain_background_tasks(order_manager):
+    """Waits for every background task, including the debounced orders broadcast scheduled by them."""
+    while order_manager._background_tasks:
+        await asyncio.gather(*order_manager._background_tasks)
+
+
 @pytest.mark.asyncio
 async def test_initialize_orders(order_manager):
     """Tests initializing the orders cache."""
@@ -101,3 +112,350 @@ async def test_update_order_filled(order_manager, mock_coordinator):
     assert '1' not in order_manager.orders_cache
     mock_coordinator.balance_manager.update_average_price_on_buy.assert_called_once()
     mock_coordinator.update_tracked_assets_and_restart_watcher.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_order_asset_names_tracks_open_orders(order_manager):
+    """Tests that order asset names follow orders being added and removed."""
+    open_orders = [
+        {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': '50000', 'amount': '1', 'filled': '0', 'status': 'open'},
+        {'id': '2', 'symbol': 'BTC/USDT', 'side': 'sell', 'price': '60000', 'amount': '1', 'filled': '0', 'status': 'open'},
+        {'id': '3', 'symbol': 'ETH/USDT', 'side': 'buy', 'price': '3000', 'amount': '1', 'filled': '0', 'status': 'open'},
+    ]
+    await order_manager.initialize_orders(open_orders)
+    assert order_manager.get_order_asset_names() == {'BTC', 'ETH'}
+
+    tasks = order_manager.update_order({**open_orders[2], 'status': 'canceled'})
+    await asyncio.gather(*tasks)
+    assert order_manager.get_order_asset_names() == {'BTC'}
+
+    tasks = order_manager.update_order({**open_orders[0], 'status': 'canceled'})
+    await asyncio.gather(*tasks)
+    assert order_manager.get_order_asset_names() == {'BTC'}
+
+
+@pytest.mark.asyncio
+async def test_cancel_all_orders(order_manager, mock_coordinator):
+    """Tests cancelling every cached order and reporting the results in one summary log."""
+    order_manager.orders_cache['1'] = {'id': '1', 'symbol': 'BTC/USDT'}
+    order_manager.orders_cache['2'] = {'id': '2', 'symbol': ''}
+    order_manager.orders_cache['3'] = {'id': '3', 'symbol': 'ETH/USDT'}
+    mock_coordinator.exchange.cancel_order = AsyncMock(side_effect=[None, Exception("boom")])
+
+    await order_manager.cancel_all_orders()
+
+    assert mock_coordinator.exchange.cancel_order.call_count == 2
+    # Only the start notice and the summary are broadcast
+    assert mock_coordinator.app['broadcast_log'].call_count == 2
+    summary = mock_coordinator.app['broadcast_log'].call_args.args[0]
+    assert summary['status'] == 'Cancel Summary'
+    assert summary['succeeded'] == ['1']
+    assert summary['failed'] == [{'symbol': 'ETH/USDT', 'order_id': '3', 'reason': 'boom'}]
+    assert summary['reason'] == '3 (ETH/USDT): boom'
+
+
+@pytest.mark.asyncio
+async def test_update_order_tracks_background_tasks(order_manager):
+    """Tests that update_order keeps task references until the tasks finish."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': '50000', 'amount': '1', 'filled': '0', 'status': 'open'}
+
+    tasks = order_manager.update_order(order)
+    assert order_manager._background_tasks == set(tasks)
+
+    await drain_background_tasks(order_manager)
+    await asyncio.sleep(0)
+    assert not order_manager._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_update_order_broadcasts_own_coordinator(order_manager, mock_coordinator):
+    """Tests that the orders update is broadcast for the owning coordinator."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': '50000', 'amount': '1', 'filled': '0', 'status': 'open'}
+
+    order_manager.update_order(order)
+    await drain_background_tasks(order_manager)
+
+    mock_coordinator.app['broadcast_orders_update'].assert_called_once_with(mock_coordinator)
+
+
+@pytest.mark.asyncio
+async def test_update_order_follow_up_survives_broadcast_failure(order_manager, mock_coordinator):
+    """Tests that a failed orders broadcast does not skip the log or tracked assets update."""
+    mock_coordinator.app['broadcast_orders_update'].side_effect = ConnectionResetError()
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': '50000', 'amount': '1', 'filled': '0', 'status': 'open'}
+
+    tasks = order_manager.update_order(order)
+    assert len(tasks) == 1
+    await asyncio.gather(*tasks)
+
+    mock_coordinator.app['broadcast_log'].assert_called_once()
+    mock_coordinator.update_tracked_assets_and_restart_watcher.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_update_order_partial_fill_amount(order_manager, mock_coordinator):
+    """Tests that a partial fill forwards the exact Decimal fill delta and keeps float cache values."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': 100.0, 'amount': 1.0, 'filled': 0.1, 'status': 'open'}
+    order_manager.orders_cache['1'] = {'id': '1', 'symbol': 'BTC/USDT', 'filled': 0.1}
+
+    tasks = order_manager.update_order({**order, 'filled': 0.3})
+    await asyncio.gather(*tasks)
+
+    mock_coordinator.balance_manager.update_average_price_on_buy.assert_called_once_with('BTC', Decimal('0.2'), Decimal('100.0'))
+    assert order_manager.orders_cache['1']['filled'] == 0.3
+
+
+@pytest.mark.asyncio
+async def test_update_order_fill_delta_keeps_exchange_precision(order_manager, mock_coordinator):
+    """Tests that the fill delta is computed from the exchange values, not the float cache."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': '100', 'amount': '1', 'filled': '0.1', 'status': 'open'}
+    await asyncio.gather(*order_manager.update_order(order))
+    await asyncio.gather(*order_manager.update_order({**order, 'filled': '0.30000000000000001'}))
+
+    mock_coordinator.balance_manager.update_average_price_on_buy.assert_called_with(
+        'BTC', Decimal('0.20000000000000001'), Decimal('100')
+    )
+    assert order_manager.orders_cache['1']['value'] == pytest.approx(70.0)
+
+
+@pytest.mark.asyncio
+async def test_cached_orders_store_asset(order_manager):
+    """Tests that cached orders carry the asset extracted from their symbol."""
+    await order_manager.initialize_orders([
+        {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': '50000', 'amount': '1', 'filled': '0', 'status': 'open'}
+    ])
+    tasks = order_manager.update_order(
+        {'id': '2', 'symbol': 'ETH/USDT', 'side': 'buy', 'price': '3000', 'amount': '1', 'filled': '0', 'status': 'open'}
+    )
+    await asyncio.gather(*tasks)
+
+    assert order_manager.orders_cache['1']['asset'] == 'BTC'
+    assert order_manager.orders_cache['2']['asset'] == 'ETH'
+
+
+@pytest.mark.asyncio
+async def test_update_order_logs_stop_price(order_manager, mock_coordinator):
+    """Tests that the stop price falls back from stopPrice to triggerPrice to the cached value."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'sell', 'price': 0, 'amount': 1.0, 'filled': 0.0,
+             'status': 'open', 'type': 'market', 'stopPrice': None, 'triggerPrice': 45000.0}
+
+    tasks = order_manager.update_order(order)
+    await asyncio.gather(*tasks)
+    log_payload = mock_coordinator.app['broadcast_log'].call_args.args[0]
+    assert log_payload['stop_price'] == 45000.0
+
+    tasks = order_manager.update_order({**order, 'stopPrice': 44000.0, 'triggerPrice': None})
+    await asyncio.gather(*tasks)
+    log_payload = mock_coordinator.app['broadcast_log'].call_args.args[0]
+    assert log_payload['stop_price'] == 44000.0
+    assert order_manager.orders_cache['1']['price'] == 44000.0
+
+    tasks = order_manager.update_order({**order, 'stopPrice': 0, 'triggerPrice': None})
+    await asyncio.gather(*tasks)
+    log_payload = mock_coordinator.app['broadcast_log'].call_args.args[0]
+    assert log_payload['stop_price'] == 44000.0
+    assert 'is_triggered' in log_payload
+
+
+@pytest.mark.asyncio
+async def test_update_order_skips_tracked_assets_refresh_on_partial_fill(order_manager, mock_coordinator):
+    """Tests that only order updates changing the order asset set refresh the tracked assets."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': 100.0, 'amount': 1.0, 'filled': 0.0, 'status': 'open'}
+
+    await asyncio.gather(*order_manager.update_order(order))
+    mock_coordinator.update_tracked_assets_and_restart_watcher.assert_called_once()
+
+    await asyncio.gather(*order_manager.update_order({**order, 'filled': 0.5}))
+    mock_coordinator.update_tracked_assets_and_restart_watcher.assert_called_once()
+
+    await asyncio.gather(*order_manager.update_order({**order, 'filled': 1.0, 'status': 'closed'}))
+    assert mock_coordinator.update_tracked_assets_and_restart_watcher.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_handle_filled_order_skips_recently_priced_asset(order_manager, mock_coordinator):
+    """Tests that rapid fills on a new holding fetch the initial price only once."""
+    mock_coordinator.balance_manager.balances_cache = {}
+    mock_coordinator.exchange.fetch_ticker = AsyncMock(return_value={'last': 100.0, 'percentage': 1.0})
+    order = {'id': '1', 'symbol': 'SOL/USDT', 'side': 'buy', 'price': 100.0}
+
+    await order_manager._handle_filled_order(order, Decimal('0.1'), 'SOL')
+    await order_manager._handle_filled_order(order, Decimal('0.2'), 'SOL')
+
+    mock_coordinator.exchange.fetch_ticker.assert_called_once_with('SOL/USDT')
+    assert mock_coordinator.balance_manager.update_average_price_on_buy.call_count == 2
+
+
+def test_recently_priced_entries_expire(order_manager, monkeypatch):
+    """Tests that expired price fetch records are evicted instead of accumulating."""
+    now = 1000.0
+    monkeypatch.setattr('crypto_dashboard.utils.exchange.order_manager.time.monotonic', lambda: now)
+    order_manager._mark_recently_priced('SOL')
+    assert order_manager._is_recently_priced('SOL')
+
+    now += order_manager.RECENT_PRICE_TTL
+    order_manager._mark_recently_priced('ADA')
+    assert order_manager._recently_priced == {'ADA': now}
+    assert not order_manager._is_recently_priced('SOL')
+
+
+@pytest.mark.asyncio
+async def test_initialize_orders_stop_market_value(order_manager):
+    """Tests that a stop-market order is valued at its stop price on the unfilled amount."""
+    await order_manager.initialize_orders([
+        {'id': '1', 'symbol': 'BTC/USDT', 'side': 'sell', 'price': None, 'stopPrice': '40000',
+         'amount': '0.5', 'filled': '0.25', 'status': 'open'}
+    ])
+
+    cached = order_manager.orders_cache['1']
+    assert cached['price'] == 40000.0
+    assert cached['stop_price'] == 40000.0
+    assert cached['value'] == pytest.approx(10000.0)
+
+
+@pytest.mark.asyncio
+async def test_cancel_all_orders_bounded_concurrency(order_manager, mock_coordinator):
+    """Tests that cancel_all_orders never has more than CANCEL_CONCURRENCY requests in flight."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def cancel_order(order_id, symbol):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    mock_coordinator.exchange.cancel_order = AsyncMock(side_effect=cancel_order)
+    order_manager.CANCEL_CONCURRENCY = 3
+    for i in range(10):
+        order_manager.orders_cache[str(i)] = {'id': str(i), 'symbol': 'BTC/USDT'}
+
+    await order_manager.cancel_all_orders()
+
+    assert mock_coordinator.exchange.cancel_order.call_count == 10
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_update_order_ignores_duplicate_event(order_manager, mock_coordinator):
+    """Tests that repeating an identical order event schedules no follow-up work."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': 100.0, 'amount': 1.0, 'filled': 0.5, 'status': 'open'}
+
+    await asyncio.gather(*order_manager.update_order(order))
+    assert order_manager.update_order(dict(order)) == []
+    mock_coordinator.app['broadcast_log'].assert_called_once()
+
+    tasks = order_manager.update_order({**order, 'filled': 0.6})
+    assert tasks
+    await asyncio.gather(*tasks)
+    assert mock_coordinator.app['broadcast_log'].call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_order_processes_events_changing_only_secondary_fields(order_manager, mock_coordinator):
+    """Tests that events changing only average, fee, trigger price or remaining are not dropped as duplicates."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': 100.0, 'amount': 1.0, 'filled': 0.5, 'status': 'open'}
+    await asyncio.gather(*order_manager.update_order(order))
+
+    for changed in ({'average': 99.5}, {'fee': {'cost': 0.1, 'currency': 'USDT'}}, {'triggerPrice': 95.0}, {'remaining': 0.4}):
+        order = {**order, **changed}
+        tasks = order_manager.update_order(order)
+        assert tasks
+        await asyncio.gather(*tasks)
+
+
+def test_is_order_triggered_uses_exchange_config(order_manager):
+    """Tests that stop trigger conditions come from the coordinator's exchange config."""
+    assert order_manager._is_order_triggered({'stopPrice': 100.0, 'info': {'isWorking': True}})
+    assert not order_manager._is_order_triggered({'stopPrice': 100.0, 'info': {'isWorking': False}})
+    assert not order_manager._is_order_triggered({'stopPrice': None, 'info': {'isWorking': True}})
+
+
+def test_is_order_triggered_ignores_malformed_conditions(mock_coordinator):
+    """Tests that malformed stop trigger conditions are skipped when compiled."""
+    mock_coordinator.config = {'stop_trigger_conditions': [
+        {'path': 'info.w'},
+        'info.isWorking',
+        {'path': 'info.w', 'expected_value': True},
+    ]}
+    order_manager = OrderManager(mock_coordinator)
+
+    assert order_manager._stop_trigger_conditions == ((('info', 'w'), True),)
+    assert order_manager._is_order_triggered({'stopPrice': 100.0, 'info': {'w': True}})
+    assert not order_manager._is_order_triggered({'stopPrice': 100.0, 'info': 'w'})
+
+
+@pytest.mark.asyncio
+async def test_cancel_all_orders_only_cancels_cached_orders(order_manager, mock_coordinator):
+    """Tests that cancel_all_orders cancels cached orders one by one even if bulk cancel is available."""
+    mock_coordinator.exchange.has = {'cancelAllOrders': True}
+    mock_coordinator.exchange.cancel_all_orders = AsyncMock()
+    mock_coordinator.exchange.cancel_order = AsyncMock(side_effect=[None, None, Exception("boom")])
+    order_manager.orders_cache['1'] = {'id': '1', 'symbol': 'BTC/USDT'}
+    order_manager.orders_cache['2'] = {'id': '2', 'symbol': 'BTC/USDT'}
+    order_manager.orders_cache['3'] = {'id': '3', 'symbol': 'ETH/USDT'}
+
+    await order_manager.cancel_all_orders()
+
+    mock_coordinator.exchange.cancel_all_orders.assert_not_called()
+    assert [c.args for c in mock_coordinator.exchange.cancel_order.call_args_list] == [
+        ('1', 'BTC/USDT'), ('2', 'BTC/USDT'), ('3', 'ETH/USDT')
+    ]
+    summary = mock_coordinator.app['broadcast_log'].call_args.args[0]
+    assert summary['succeeded'] == ['1', '2']
+    assert summary['failed'] == [{'symbol': 'ETH/USDT', 'order_id': '3', 'reason': 'boom'}]
+
+
+@pytest.mark.asyncio
+async def test_update_order_coalesces_orders_broadcast(order_manager, mock_coordinator):
+    """Tests that a burst of order events sends the orders list only once."""
+    tasks = []
+    for i in range(5):
+        tasks += order_manager.update_order(
+            {'id': str(i), 'symbol': 'BTC/USDT', 'side': 'buy', 'price': 100.0, 'amount': 1.0, 'filled': 0.0, 'status': 'open'}
+        )
+    await drain_background_tasks(order_manager)
+
+    mock_coordinator.app['broadcast_orders_update'].assert_called_once_with(mock_coordinator)
+    assert mock_coordinator.app['broadcast_log'].call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_update_order_does_not_wait_for_orders_broadcast(order_manager, mock_coordinator):
+    """Tests that the log and tracked assets update run before the debounced orders broadcast is sent."""
+    order = {'id': '1', 'symbol': 'BTC/USDT', 'side': 'buy', 'price': '50000', 'amount': '1', 'filled': '0', 'status': 'open'}
+
+    tasks = order_manager.update_order(order)
+    await asyncio.gather(*tasks)
+
+    mock_coordinator.app['broadcast_log'].assert_called_once()
+    mock_coordinator.update_tracked_assets_and_restart_watcher.assert_called_once()
+    mock_coordinator.app['broadcast_orders_update'].assert_not_called()
+
+    await drain_background_tasks(order_manager)
+    mock_coordinator.app['broadcast_orders_update'].assert_called_once_with(mock_coordinator)
+
+
+@pytest.mark.asyncio
+async def test_handle_filled_order_uses_known_price(order_manager, mock_coordinator):
+    """Tests that a new holding whose price is already known does not fetch a ticker."""
+    mock_coordinator.balance_manager.balances_cache = {}
+    mock_coordinator.price_manager.get_cached_price.return_value = Decimal('100')
+    mock_coordinator.exchange.fetch_ticker = AsyncMock()
+    order = {'id': '1', 'symbol': 'SOL/USDT', 'side': 'buy', 'price': 100.0}
+
+    await order_manager._handle_filled_order(order, Decimal('0.1'), 'SOL')
+
+    mock_coordinator.price_manager.get_cached_price.assert_called_once_with('SOL')
+    mock_coordinator.exchange.fetch_ticker.assert_not_called()
+    mock_coordinator.balance_manager.update_average_price_on_buy.assert_called_once()
+
+
+def test_to_float():
+    """Tests order field conversion to float."""
+    assert OrderManager._to_float(1.5) == 1.5
+    assert OrderManager._to_float('2.5') == 2.5
+    assert OrderManager._to_float(3) == 3.0
+    assert OrderManager._to_float(None) == 0.0
+    assert OrderManager._to_float('') == 0.0
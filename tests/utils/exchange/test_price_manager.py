@@ -0,0 +1,160 @@
+import asyncio
+import time
+from decimal import Decimal
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+
+from crypto_dashboard.utils.exchange.price_manager import PriceManager
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Creates a mock ExchangeCoordinator with necessary attributes."""
+    coordinator = MagicMock()
+    coordinator.logger = MagicMock()
+    coordinator.name = "test_exchange"
+    coordinator.quote_currency = "USDT"
+    coordinator.config = {}
+    coordinator.app = {
+        'broadcast_message': AsyncMock(),
+    }
+    coordinator.tracked_assets = {'BTC', 'ETH', 'USDT'}
+    coordinator.balance_manager = MagicMock()
+    coordinator.balance_manager.balances_cache = {'BTC': {'price': Decimal('0')}}
+    coordinator.balance_manager.update_unrealised_pnl = MagicMock(return_value=Decimal('1.5'))
+    coordinator.exchange = MagicMock()
+    return coordinator
+
+
+@pytest.fixture
+def price_manager(mock_coordinator):
+    """Creates a PriceManager instance with a mock coordinator and one connected client."""
+    price_manager = PriceManager(mock_coordinator)
+    price_manager._clients = {MagicMock()}
+    return price_manager
+
+
+def test_get_tracked_symbols(price_manager):
+    """Tests that tracked symbols exclude the quote currency and reading them changes no state."""
+    price_manager._last_prices = {'XRP/USDT': (0.5, 0.0)}
+
+    symbols = price_manager.get_tracked_symbols()
+
+    assert sorted(symbols) == ['BTC/USDT', 'ETH/USDT']
+    assert price_manager._symbol_to_asset == {}
+    assert price_manager._last_prices == {'XRP/USDT': (0.5, 0.0)}
+
+
+@pytest.mark.asyncio
+async def test_watch_tickers_loop_rebuilds_symbol_map_on_start(price_manager, mock_coordinator):
+    """Tests that starting the watcher maps the new symbols and drops prices of untracked symbols."""
+    price_manager._last_prices = {'BTC/USDT': (50000.0, 0.0), 'XRP/USDT': (0.5, 0.0)}
+    mock_coordinator.exchange.watch_tickers = AsyncMock(side_effect=asyncio.CancelledError())
+
+    await price_manager.watch_tickers_loop(['BTC/USDT', 'ETH/USDT'])
+
+    assert price_manager._symbol_to_asset == {'BTC/USDT': 'BTC', 'ETH/USDT': 'ETH'}
+    assert price_manager._last_prices == {'BTC/USDT': (50000.0, 0.0)}
+
+
+@pytest.mark.asyncio
+async def test_watch_tickers_loop_updates_held_and_followed_assets(price_manager, mock_coordinator):
+    """Tests that held assets get PnL and cache updates while followed assets are only broadcast."""
+    mock_coordinator.exchange.watch_tickers = AsyncMock(side_effect=[
+        {
+            'BTC/USDT': {'last': 50000.0, 'percentage': 2.0},
+            'ETH/USDT': {'last': 3000.0, 'percentage': -1.0},
+        },
+        asyncio.CancelledError(),
+    ])
+
+    await price_manager.watch_tickers_loop(price_manager.get_tracked_symbols())
+
+    mock_coordinator.balance_manager.update_unrealised_pnl.assert_called_once_with('BTC', Decimal('50000.0'))
+    mock_coordinator.balance_manager.update_price.assert_called_once_with('BTC', Decimal('50000.0'))
+    mock_coordinator.app['broadcast_message'].assert_awaited_once_with({
+        'type': 'price_updates',
+        'exchange': 'test_exchange',
+        'updates': [
+            {'symbol': 'BTC/USDT', 'price': 50000.0, 'percentage': 2.0, 'unrealised_pnl': '1.5'},
+            {'symbol': 'ETH/USDT', 'price': 3000.0, 'percentage': -1.0, 'unrealised_pnl': None},
+        ],
+    })
+
+
+@pytest.mark.asyncio
+async def test_watch_tickers_loop_sends_per_symbol_updates_when_batching_disabled(mock_coordinator):
+    """Tests that disabling batch_price_updates keeps the per-symbol price_update messages."""
+    mock_coordinator.config = {'batch_price_updates': False}
+    price_manager = PriceManager(mock_coordinator)
+    price_manager._clients = {MagicMock()}
+    mock_coordinator.exchange.watch_tickers = AsyncMock(side_effect=[
+        {
+            'BTC/USDT': {'last': 50000.0, 'percentage': 2.0},
+            'ETH/USDT': {'last': 3000.0, 'percentage': -1.0},
+        },
+        asyncio.CancelledError(),
+    ])
+
+    await price_manager.watch_tickers_loop(price_manager.get_tracked_symbols())
+
+    messages = [c.args[0] for c in mock_coordinator.app['broadcast_message'].call_args_list]
+    assert messages == [
+        {'type': 'price_update', 'exchange': 'test_exchange', 'symbol': 'BTC/USDT',
+         'price': 50000.0, 'percentage': 2.0, 'unrealised_pnl': '1.5'},
+        {'type': 'price_update', 'exchange': 'test_exchange', 'symbol': 'ETH/USDT',
+         'price': 3000.0, 'percentage': -1.0, 'unrealised_pnl': None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_initialize_prices_falls_back_to_individual_fetches(price_manager, mock_coordinator):
+    """Tests that a failed batch fetch falls back to individual fetches and skips failing symbols."""
+    mock_coordinator.exchange.fetch_tickers = AsyncMock(side_effect=Exception("not supported"))
+
+    async def fetch_ticker(symbol):
+        if symbol == 'ETH/USDT':
+            raise Exception("boom")
+        return {'last': 50000.0}
+
+    mock_coordinator.exchange.fetch_ticker = AsyncMock(side_effect=fetch_ticker)
+
+    await price_manager.initialize_prices_for_tracked_assets({'BTC', 'ETH', 'USDT'})
+
+    assert mock_coordinator.exchange.fetch_ticker.call_count == 2
+    mock_coordinator.balance_manager.update_price.assert_called_once_with('BTC', Decimal('50000.0'))
+
+
+@pytest.mark.asyncio
+async def test_get_cached_price(price_manager, mock_coordinator):
+    """Tests that cached prices come from the balance cache first, then from the last broadcast price."""
+    mock_coordinator.balance_manager.balances_cache = {'BTC': {'price': Decimal('50000')}}
+
+    await price_manager._update_asset_price('BTC', 'BTC/USDT', 50000.0)
+    await price_manager._broadcast_price_update('ETH/USDT', 3000.0)
+
+    assert price_manager.get_cached_price('BTC') == Decimal('50000')
+    assert price_manager.get_cached_price('ETH') == Decimal('3000.0')
+    assert price_manager.get_cached_price('SOL') is None
+
+
+@pytest.mark.asyncio
+async def test_price_update_skipped_without_clients(price_manager, mock_coordinator):
+    """Tests that no price_update is sent without clients while the last price is still recorded."""
+    price_manager._clients = set()
+
+    await price_manager._update_asset_price('ETH', 'ETH/USDT', 3000.0)
+
+    mock_coordinator.app['broadcast_message'].assert_not_called()
+    assert price_manager.get_cached_price('ETH') == Decimal('3000.0')
+
+
+def test_get_cached_price_ignores_stale_prices(price_manager, mock_coordinator):
+    """Tests that prices older than CACHED_PRICE_TTL are not returned so callers fetch a fresh one."""
+    mock_coordinator.balance_manager.balances_cache = {'BTC': {'price': Decimal('50000')}}
+    stale_at = time.monotonic() - PriceManager.CACHED_PRICE_TTL
+    price_manager._last_prices = {'BTC/USDT': (50000.0, stale_at), 'ETH/USDT': (3000.0, stale_at)}
+
+    assert price_manager.get_cached_price('BTC') is None
+    assert price_manager.get_cached_price('ETH') is None
@@ -1,11 +1,12 @@
 import pytest
 from decimal import Decimal
 import logging
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock
 
-from src.crypto_dashboard.models.trade_models import TradeIntent
-from src.crypto_dashboard.utils.nlp.entity_extractor import EntityExtractor
-from src.crypto_dashboard.utils.nlp.trade_command_parser import TradeCommandParser
+from crypto_dashboard.models.trade_models import TradeIntent
+from crypto_dashboard.utils.nlp.entity_extractor import EntityExtractor
+from crypto_dashboard.utils.nlp.trade_command_parser import TradeCommandParser
 
 @pytest.fixture
 def entity_extractor():
@@ -17,35 +18,44 @@ def entity_extractor():
     }
     return EntityExtractor(coins, config, logging.getLogger(__name__))
 
+def price_to_precision(symbol, price):
+    return f"{price:.2f}"
+
+def amount_to_precision(symbol, amount):
+    return f"{amount:.5f}"
+
 @pytest.fixture
 def mock_exchange_base():
-    mock = MagicMock()
-    mock.quote_currency = "USDT"
-
-    # Mock exchange attributes and methods
-    mock.exchange.price_to_precision = MagicMock(side_effect=lambda symbol, price: f"{price:.2f}")
-    mock.exchange.amount_to_precision = MagicMock(side_effect=lambda symbol, amount: f"{amount:.5f}")
-    mock.exchange.load_markets = AsyncMock()
-    # Start with some initial markets
-    mock.exchange.markets = {
-        'BTC/USDT': {'base': 'BTC', 'quote': 'USDT', 'active': True},
-        'ETH/USDT': {'base': 'ETH', 'quote': 'USDT', 'active': True},
-    }
+    """Builds only the attributes the parser uses; unknown attributes raise instead of auto-mocking."""
+    # Plain functions; tests that count calls wrap them with Mock(wraps=...)
+    exchange = SimpleNamespace(
+        price_to_precision=price_to_precision,
+        amount_to_precision=amount_to_precision,
+        load_markets=AsyncMock(),
+        # Start with some initial markets
+        markets={
+            'BTC/USDT': {'base': 'BTC', 'quote': 'USDT', 'active': True},
+            'ETH/USDT': {'base': 'ETH', 'quote': 'USDT', 'active': True},
+        },
+    )
+    price_manager = SimpleNamespace(
+        get_order_book=AsyncMock(return_value={'bid': 100.0, 'ask': 101.0}),
+        get_current_price=AsyncMock(return_value=100.5),
+    )
+    balances_cache = SimpleNamespace(get=MagicMock(return_value={'free': Decimal('10')}))
 
-    # Mock price_manager
-    mock.price_manager.get_order_book = AsyncMock(return_value={'bid': 100.0, 'ask': 101.0})
-    mock.price_manager.get_current_price = AsyncMock(return_value=100.5)
-
-    # Mock balances_cache
-    mock.balances_cache.get = MagicMock(return_value={'free': Decimal('10')})
-    
-    return mock
+    return SimpleNamespace(
+        quote_currency="USDT",
+        exchange=exchange,
+        price_manager=price_manager,
+        balances_cache=balances_cache,
+    )
 
 @pytest.fixture
 def trade_command_parser(entity_extractor, mock_exchange_base):
     return TradeCommandParser(entity_extractor, mock_exchange_base, logging.getLogger(__name__))
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_simple_limit_buy(trade_command_parser):
     text = "buy 1 btc 90"
     command = await trade_command_parser.parse(text)
@@ -56,7 +66,7 @@ async def test_parse_simple_limit_buy(trade_command_parser):
     assert command.price == "90.00"
     assert command.order_type == "limit"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_relative_price_and_stop_price(trade_command_parser):
     text = "buy 1 btc -10% stop -15%"
     command = await trade_command_parser.parse(text)
@@ -70,7 +80,7 @@ async def test_parse_relative_price_and_stop_price(trade_command_parser):
     assert command.stop_price == "85.00"
     assert command.order_type == "limit"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_fixed_stop_price(trade_command_parser):
     text = "buy 1 btc 90 stop 85"
     command = await trade_command_parser.parse(text)
@@ -82,7 +92,7 @@ async def test_parse_fixed_stop_price(trade_command_parser):
     assert command.stop_price == "85.00"
     assert command.order_type == "limit"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_fixed_price_and_relative_stop_price(trade_command_parser):
     text = "buy 1 btc 90 stop -5%"
     command = await trade_command_parser.parse(text)
@@ -95,7 +105,7 @@ async def test_parse_fixed_price_and_relative_stop_price(trade_command_parser):
     assert command.stop_price == "95.00"
     assert command.order_type == "limit"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_relative_price_and_fixed_stop_price(trade_command_parser):
     text = "buy 1 btc -10% stop 85"
     command = await trade_command_parser.parse(text)
@@ -108,7 +118,7 @@ async def test_parse_relative_price_and_fixed_stop_price(trade_command_parser):
     assert command.stop_price == "85.00"
     assert command.order_type == "limit"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_stop_market_order(trade_command_parser):
     text = "sell 1 btc stop 105"
     command = await trade_command_parser.parse(text)
@@ -120,11 +130,11 @@ async def test_parse_stop_market_order(trade_command_parser):
     assert command.stop_price == "105.00"
     assert command.order_type == "market" # Interpreted as a stop-market order
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_total_cost_order(trade_command_parser, mock_exchange_base):
     text = "buy btc for 1000 usdt"
     
-    mock_exchange_base.price_manager.get_current_price = AsyncMock(return_value=100.0)
+    mock_exchange_base.price_manager.get_current_price.return_value = 100.0
     
     command = await trade_command_parser.parse(text)
     assert isinstance(command, TradeIntent)
@@ -135,7 +145,17 @@ async def test_parse_total_cost_order(trade_command_parser, mock_exchange_base):
     assert command.total_cost == "1000"
     assert command.order_type == "market"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
+async def test_parse_total_cost_with_relative_price(trade_command_parser):
+    """A relative limit price combined with a total cost still yields a Decimal amount."""
+    command = await trade_command_parser.parse("buy BTC 100 usdt -5%")
+    assert isinstance(command, TradeIntent)
+    # base_price (bid) is 100, so -5% is 95 and 100 usdt buys 100 / 95
+    assert command.price == "95.00"
+    assert command.amount == "1.05263"
+    assert command.order_type == "limit"
+
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_relative_amount_order(trade_command_parser, mock_exchange_base):
     text = "sell 50% xrp"
     mock_exchange_base.balances_cache.get.return_value = {'free': Decimal('20')}
@@ -148,28 +168,28 @@ async def test_parse_relative_amount_order(trade_command_parser, mock_exchange_b
     assert command.amount == "10.00000"
     assert command.order_type == "market"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_fail_missing_intent(trade_command_parser):
     text = "1 btc 90"
     result = await trade_command_parser.parse(text)
     assert isinstance(result, str)
     assert "Missing intent or coin" in result
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_fail_missing_coin(trade_command_parser):
     text = "buy 1 90"
     result = await trade_command_parser.parse(text)
     assert isinstance(result, str)
     assert "Missing intent or coin" in result
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_fail_missing_amount(trade_command_parser):
     text = "buy btc"
     result = await trade_command_parser.parse(text)
     assert isinstance(result, str)
     assert "Missing amount information" in result
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_market_refresh_on_unknown_coin(trade_command_parser, mock_exchange_base, entity_extractor):
     text = "buy 100 doge 0.1"
     
@@ -180,7 +200,7 @@ async def test_market_refresh_on_unknown_coin(trade_command_parser, mock_exchang
     async def mock_load_markets(reload=False):
         mock_exchange_base.exchange.markets['DOGE/USDT'] = {'base': 'DOGE', 'quote': 'USDT', 'active': True}
 
-    mock_exchange_base.exchange.load_markets = AsyncMock(side_effect=mock_load_markets)
+    mock_exchange_base.exchange.load_markets.side_effect = mock_load_markets
 
     command = await trade_command_parser.parse(text)
 
@@ -193,10 +213,10 @@ async def test_market_refresh_on_unknown_coin(trade_command_parser, mock_exchang
     assert command.amount == "100.00000"
     assert command.price == "0.10"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_oco_limit_stop_market_buy_order(trade_command_parser, mock_exchange_base):
     # Set current price to 100.5 for this test
-    mock_exchange_base.price_manager.get_current_price = AsyncMock(return_value=100.5)
+    mock_exchange_base.price_manager.get_current_price.return_value = 100.5
     
     # Buy order where price (95) < current_price (100.5) and stop_price (105) > current_price (100.5)
     text = "buy btc 10usdt 95 stop 105"
@@ -211,10 +231,10 @@ async def test_parse_oco_limit_stop_market_buy_order(trade_command_parser, mock_
     assert command.stop_price == "105.00"
     assert command.order_type == "oco_stop_market"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_oco_limit_stop_market_sell_order(trade_command_parser, mock_exchange_base):
     # Set current price to 100.5 for this test
-    mock_exchange_base.price_manager.get_current_price = AsyncMock(return_value=100.5)
+    mock_exchange_base.price_manager.get_current_price.return_value = 100.5
     
     # Sell order where price (105) > current_price (100.5) and stop_price (95) < current_price (100.5)
     text = "sell 1 btc 105 stop 95"
@@ -228,10 +248,10 @@ async def test_parse_oco_limit_stop_market_sell_order(trade_command_parser, mock
     assert command.stop_price == "95.00"
     assert command.order_type == "oco_stop_market"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_not_oco_buy_order(trade_command_parser, mock_exchange_base):
     # Set current price to 100.5 for this test
-    mock_exchange_base.price_manager.get_current_price = AsyncMock(return_value=100.5)
+    mock_exchange_base.price_manager.get_current_price.return_value = 100.5
     
     # This is a standard stop-limit order, not OCO, because price > current_price
     text = "buy 1 btc 102 stop 105"
@@ -240,11 +260,11 @@ async def test_parse_not_oco_buy_order(trade_command_parser, mock_exchange_base)
     assert isinstance(command, TradeIntent)
     assert command.order_type == "limit" # Not "oco"
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_parse_oco_stop_limit_buy_order(trade_command_parser, mock_exchange_base):
     # Set current price and order book specifically for this test
-    mock_exchange_base.price_manager.get_current_price = AsyncMock(return_value=100000.0)
-    mock_exchange_base.price_manager.get_order_book = AsyncMock(return_value={'bid': 100000.0, 'ask': 100001.0})
+    mock_exchange_base.price_manager.get_current_price.return_value = 100000.0
+    mock_exchange_base.price_manager.get_order_book.return_value = {'bid': 100000.0, 'ask': 100001.0}
     
     # Buy order with stop_limit_price using 'limit +5'
     text = "buy 0.1 btc 95k stop 110000 limit +5"
@@ -258,3 +278,42 @@ async def test_parse_oco_stop_limit_buy_order(trade_command_parser, mock_exchang
     assert command.stop_price == "110000.00"
     assert command.stop_limit_price == "105000.00" # 100000 * (1 + 5/100)
     assert command.order_type == "oco_stop_limit"
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_adjust_precision_is_cached_until_markets_reload(trade_command_parser, mock_exchange_base):
+    """Repeated precision adjustments reuse the cached result until the markets are reloaded."""
+    mock_exchange_base.exchange.price_to_precision = Mock(wraps=price_to_precision)
+    mock_exchange_base.exchange.amount_to_precision = Mock(wraps=amount_to_precision)
+
+    for _ in range(2):
+        command = await trade_command_parser.parse("buy 1 btc 90")
+        assert command.price == "90.00"
+
+    assert mock_exchange_base.exchange.price_to_precision.call_count == 1
+    assert mock_exchange_base.exchange.amount_to_precision.call_count == 1
+
+    # An unknown coin with an amount triggers a market reload, which clears the cache.
+    await trade_command_parser.parse("buy 1 unknowncoin")
+    await trade_command_parser.parse("buy 1 btc 90")
+
+    mock_exchange_base.exchange.load_markets.assert_awaited_once_with(reload=True)
+    assert mock_exchange_base.exchange.price_to_precision.call_count == 2
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_parse_fetches_order_book_once_per_command(trade_command_parser, mock_exchange_base):
+    """A relative stop price with an implicit current-price order reuses the same order book."""
+    trade_command_parser.extractor.extract_entities = MagicMock(return_value={
+        "intent": "buy", "coin": "BTC", "amount": Decimal("1"), "price": None,
+        "relative_price": None, "relative_amount": None, "total_cost": None,
+        "stop_price": None, "relative_stop_price": Decimal("5"),
+        "stop_limit_price": None, "relative_stop_limit_price": None,
+        "current_price_order": True, "order_type": "limit",
+    })
+
+    command = await trade_command_parser.parse("buy 1 btc")
+
+    mock_exchange_base.price_manager.get_order_book.assert_awaited_once_with("BTC")
+    assert command.price == "100.00"
+    assert command.stop_price == "105.00"
@@ -0,0 +1,121 @@
+import json
+from collections import deque
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crypto_dashboard.utils import broadcast
+
+
+@pytest.mark.asyncio
+async def test_broadcast_message_serializes_once(monkeypatch):
+    """Tests that a message is serialized once and the same text is sent to every client."""
+    clients = {MagicMock(send_str=AsyncMock()) for _ in range(3)}
+    monkeypatch.setattr(broadcast, 'clients', clients)
+    dumps = MagicMock(wraps=broadcast.dumps_message)
+    monkeypatch.setattr(broadcast, 'dumps_message', dumps)
+
+    message = {'type': 'price_update', 'symbol': 'BTC/USDT', 'price': 50000.0}
+    await broadcast.basic_broadcast_message(message)
+
+    dumps.assert_called_once_with(message)
+    for ws in clients:
+        ws.send_str.assert_called_once()
+        assert json.loads(ws.send_str.call_args.args[0]) == message
+
+
+@pytest.mark.asyncio
+async def test_broadcast_message_skips_disconnected_client(monkeypatch):
+    """Tests that a disconnected client does not stop the broadcast to others."""
+    broken = MagicMock(send_str=AsyncMock(side_effect=ConnectionResetError()))
+    healthy = MagicMock(send_str=AsyncMock())
+    monkeypatch.setattr(broadcast, 'clients', {broken, healthy})
+
+    await broadcast.basic_broadcast_message({'type': 'log'})
+
+    healthy.send_str.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_log_caches_serialized_message(monkeypatch):
+    """Tests that a log is serialized once and the cached text matches what clients received."""
+    ws = MagicMock(send_str=AsyncMock())
+    monkeypatch.setattr(broadcast, 'clients', {ws})
+    monkeypatch.setattr(broadcast, 'log_cache', deque(maxlen=2))
+    dumps = MagicMock(wraps=broadcast.dumps_message)
+    monkeypatch.setattr(broadcast, 'dumps_message', dumps)
+
+    await broadcast.basic_broadcast_log('Order filled', 'binance', MagicMock())
+
+    dumps.assert_called_once()
+    assert list(broadcast.get_log_cache()) == [ws.send_str.call_args.args[0]]
+    cached = json.loads(broadcast.get_log_cache()[0])
+    assert (cached['type'], cached['message'], cached['exchange']) == ('log', 'Order filled', 'binance')
+
+
+@pytest.mark.asyncio
+async def test_broadcast_log_cache_is_bounded(monkeypatch):
+    """Tests that only the most recent logs are kept for replay to new clients."""
+    monkeypatch.setattr(broadcast, 'clients', set())
+    monkeypatch.setattr(broadcast, 'log_cache', deque(maxlen=2))
+
+    for i in range(3):
+        await broadcast.basic_broadcast_log(f'log {i}', 'binance', MagicMock())
+
+    assert [json.loads(data)['message'] for data in broadcast.get_log_cache()] == ['log 1', 'log 2']
+
+
+@pytest.mark.asyncio
+async def test_broadcast_log_skips_unserializable_message(monkeypatch):
+    """Tests that a log that cannot be serialized is neither cached nor raised to the caller."""
+    monkeypatch.setattr(broadcast, 'clients', set())
+    monkeypatch.setattr(broadcast, 'log_cache', deque(maxlen=2))
+
+    await broadcast.basic_broadcast_log({'bad': object()}, 'binance', MagicMock())
+
+    assert not broadcast.get_log_cache()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_orders_update_sends_exchange_once(monkeypatch):
+    """Tests that the exchange name is sent once per message and cached orders are not modified."""
+    ws = MagicMock(send_str=AsyncMock())
+    monkeypatch.setattr(broadcast, 'clients', {ws})
+    order = {'id': '1', 'symbol': 'BTC/USDT'}
+    exchange = MagicMock()
+    exchange.name = 'binance'
+    exchange.order_manager.orders_cache = {'1': order}
+
+    await broadcast.basic_broadcast_orders_update(exchange)
+
+    assert json.loads(ws.send_str.call_args.args[0]) == {
+        'type': 'orders_update', 'exchange': 'binance', 'data': [{'id': '1', 'symbol': 'BTC/USDT'}]
+    }
+    assert 'exchange' not in order
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+def test_dumps_message_matches_between_serializers(monkeypatch, use_orjson):
+    """Both the optional orjson path and the json fallback keep Decimal precision and accept non-string keys."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(broadcast, "orjson", None)
+
+    message = {'type': 'log', 'price': Decimal('0.30000000000000001'), 'info': {1: 'a'}}
+
+    assert json.loads(broadcast.dumps_message(message)) == {
+        'type': 'log', 'price': '0.30000000000000001', 'info': {'1': 'a'}
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_broadcast_task_runs_eagerly_when_supported(monkeypatch):
+    """Tests that a broadcast task finishes without yielding to the loop when eager tasks are available."""
+    monkeypatch.setattr(broadcast, 'clients', set())
+
+    task = broadcast.create_broadcast_task(broadcast.basic_broadcast_message({'type': 'ping'}))
+
+    assert task.done() is (broadcast._eager_task_factory is not None)
+    await task
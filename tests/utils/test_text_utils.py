@@ -0,0 +1,74 @@
+import sys
+import unicodedata
+
+from crypto_dashboard.utils.text_utils import clean_and_sanitize, clean_text, expand_k_suffix, sanitize_input
+
+
+def test_clean_text_matches_per_character_filter():
+    """The precompiled pattern removes exactly the non-printable assigned and non-BMP characters."""
+    all_chars = ''.join(
+        chr(code_point) for code_point in range(sys.maxunicode + 1)
+        if unicodedata.category(chr(code_point)) != 'Cn'
+    )
+    normalized = unicodedata.normalize('NFKC', all_chars)
+    expected = ''.join(c for c in normalized if c.isprintable() and ord(c) < 0x10000)
+
+    assert clean_text(all_chars) == expected
+
+
+def test_clean_text_keeps_korean_and_strips_control_characters():
+    """Korean text survives while control, zero-width and emoji characters are dropped."""
+    assert clean_text("비트코인\t1개​ 사줘\U0001F600") == "비트코인1개 사줘"
+
+
+def test_clean_text_returns_printable_ascii_unchanged():
+    """Printable ASCII input is returned as is, while ASCII control characters are still removed."""
+    assert clean_text("buy 1 btc 90") == "buy 1 btc 90"
+    assert clean_text("buy\x00 1 btc") == "buy 1 btc"
+
+
+def test_sanitize_input_escapes_only_single_quotes():
+    """Only single quotes are escaped, as before, and surrounding whitespace is stripped."""
+    assert sanitize_input('  <b>"BTC" & \'ETH\'</b>  ') == '<b>"BTC" & &#x27;ETH&#x27;</b>'
+    assert sanitize_input(sanitize_input("btc & it's")) == "btc & it&#x27;s"
+    assert sanitize_input("   ") == ""
+    assert sanitize_input("a" * 501) == ""
+
+
+def test_sanitize_input_returns_plain_text_stripped():
+    """Input without HTML special characters is only stripped."""
+    assert sanitize_input("  비트코인 1개 사줘 ") == "비트코인 1개 사줘"
+
+
+def test_clean_text_is_idempotent_for_normalized_and_compatibility_text():
+    """Already-normalized Hangul is kept as is, while compatibility characters are still normalized."""
+    assert clean_text("비트코인") == "비트코인"
+    assert clean_text(clean_text("비트코인")) == "비트코인"
+    assert clean_text("ＢＴＣ １개") == "BTC 1개"
+
+
+def test_sanitize_input_rejects_non_string_input():
+    """Non-string input is rejected before reaching the cached helper."""
+    assert sanitize_input(["buy", "btc"]) == ""
+    assert sanitize_input(None) == ""
+
+
+def test_expand_k_suffix():
+    """Numbers followed by k are multiplied by 1000, other k's are left alone."""
+    assert expand_k_suffix("buy 1 btc 30k") == "buy 1 btc 30000"
+    assert expand_k_suffix("2.67K 0.5 k") == "2670 500"
+    assert expand_k_suffix("1klay 5kg") == "1klay 5kg"
+
+
+def test_expand_k_suffix_integer_fast_path_matches_decimal_formatting():
+    """Integer inputs skip Decimal but keep its formatting, including leading zeros and zero."""
+    assert expand_k_suffix("030k") == "30000"
+    assert expand_k_suffix("0k") == "0"
+    assert expand_k_suffix("1.0k") == "1000"
+
+
+def test_clean_and_sanitize_matches_separate_calls():
+    """The combined helper gives the same result as clean_text followed by sanitize_input."""
+    for text in ["  ＢＴＣ <1개> 사줘\x00 ", "buy 1 btc 90", "\t\n", ""]:
+        assert clean_and_sanitize(text) == sanitize_input(clean_text(text))
+    assert clean_and_sanitize(None) == ""
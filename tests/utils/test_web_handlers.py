@@ -0,0 +1,30 @@
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crypto_dashboard.utils.nlp.entity_extractor import EntityExtractor
+from crypto_dashboard.utils.web_handlers import _handle_nlp_command
+
+
+@pytest.mark.asyncio
+async def test_nlp_command_text_is_escaped_only_once():
+    """Tests that command text is escaped once by the handler and not again by the entity extractor."""
+    extractor = EntityExtractor(["BTC"], {"quote_currency": "USDT"}, logging.getLogger(__name__))
+    extractor._extract_coin = MagicMock(wraps=extractor._extract_coin)
+
+    coordinator = MagicMock()
+    coordinator.is_nlp_ready.return_value = True
+
+    async def parse_command(text):
+        extractor.extract_entities(text)
+        return "unparsed"
+
+    coordinator.nlp_trade_manager.parse_command = AsyncMock(side_effect=parse_command)
+    send_json = AsyncMock()
+
+    await _handle_nlp_command(send_json, {}, coordinator, "binance", {'text': " btc & it's "})
+
+    coordinator.nlp_trade_manager.parse_command.assert_awaited_once_with("btc & it&#x27;s")
+    assert extractor._extract_coin.call_args.args[0] == "btc & it&#x27;s"
+    send_json.assert_awaited_once_with({'type': 'nlp_error', 'message': 'unparsed'})